@@ -26,3 +26,8 @@ runday () {
         fi
     fi
 }
+
+# AoC runall command
+runall () {
+    python /Users/work/dev/AoC2024/runner.py "$@"
+}
@@ -1,8 +1,10 @@
 """AoC :: Day 5"""
-import time
+import os
+import sys
 from typing import TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 5
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
 
 
 def parse(file: TextIO):
@@ -78,30 +80,8 @@ def median(rules: dict[int, set[int]], update: set[int], k: int) -> int:
     return median(rules, gt_candidate, k - N - 1)
 
 
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
-
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        rules, updates = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
-
-    # Part One
-    print(":: Part One + Two ::")
-    t1 = -time.time()
-    a1, a2 = part_one(rules, updates)
-    t1 += time.time()
-    print(f"Part One Answer: {a1}")
-    print(f"Part Two Answer: {a2}")
-    print(f"runtime: {t1: .4f}s")
-
-    print(f":: total runtime: {t0+t1: .4f}s ::")
+solution = register(Solution(DAY, parse, part_one, fused=True, unpack=True))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
@@ -1,10 +1,15 @@
 """AoC :: Day 6"""
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-import time
-from typing import TextIO
+import os
+import sys
+from typing import Iterable, Optional, TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 6
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
 
 
 class Direction(Enum):
@@ -18,8 +23,10 @@ class Direction(Enum):
         """Turn 90 degrees clockwise"""
         return Direction(self.value * 1j)
 
-    def cast(self, position: complex, obstacles: set[complex]):
+    def cast(self, position: complex, obstacles: "set[complex] | ObstacleIndex"):
         """cast a ray to find the closest obstacle is in the direction of travel"""
+        if isinstance(obstacles, ObstacleIndex):
+            return obstacles.ahead(position, self)
         match self:
             case Direction.UP:
                 return any(
@@ -68,6 +75,183 @@ class Guard:
         self.position = next_position
         return False
 
+    def route(self, obstacles: "set[complex] | ObstacleIndex", bounds: complex) -> list[tuple[complex, Direction]]:
+        """Patrol out of bounds, returning each position and the direction the guard left it in"""
+        route = []
+        while (0 <= self.position.real < bounds.real) and (0 <= self.position.imag < bounds.imag):
+            while (next_position := self.position + self.direction.value) in obstacles:
+                self.direction = self.direction.turn()
+            route.append((self.position, self.direction))
+            self.position = next_position
+        return route
+
+
+class StateStore:
+    """
+    The guard states seen while exploring, without allocating per state
+
+    Each cell of the map is a byte at y*width+x holding one bit for each
+    direction the guard has been there facing. A cell only counts if its
+    stamp matches the current generation, so reset() is O(1).
+    """
+    BITS = {Direction.UP: 1, Direction.RIGHT: 2, Direction.DOWN: 4, Direction.LEFT: 8}
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.bits = bytearray(width * height)
+        self.stamps = array('I', bytes(4 * width * height))
+        self.generation = 1
+
+    def reset(self):
+        """Forget every state"""
+        self.generation += 1
+        if self.generation >= 2**32:
+            # Only once the stamps would overflow do they need clearing
+            self.stamps = array('I', bytes(4 * len(self.bits)))
+            self.generation = 1
+
+    def visit(self, position: complex, direction: Direction) -> bool:
+        """Record a state, returning True if it had already been seen"""
+        cell = int(position.imag) * self.width + int(position.real)
+        bit = self.BITS[direction]
+        if self.stamps[cell] != self.generation:
+            self.stamps[cell] = self.generation
+            self.bits[cell] = bit
+            return False
+        if self.bits[cell] & bit:
+            return True
+        self.bits[cell] |= bit
+        return False
+
+
+class ObstacleIndex:
+    """
+    Obstacles indexed by row and by column
+
+    rows[y] holds the sorted x coordinates of the obstacles in row y and
+    cols[x] the sorted y coordinates of the obstacles in column x, so the
+    next obstacle in any direction is a single bisect. Whether there is any
+    obstacle ahead at all only needs the ends of a line. One extra obstacle
+    can be placed temporarily without rebuilding the index.
+    """
+    def __init__(self, obstacles: set[complex]):
+        self.obstacles = obstacles
+        self.rows: dict[int, list[int]] = {}
+        self.cols: dict[int, list[int]] = {}
+        for obstacle in obstacles:
+            x, y = int(obstacle.real), int(obstacle.imag)
+            self.rows.setdefault(y, []).append(x)
+            self.cols.setdefault(x, []).append(y)
+        for line in (*self.rows.values(), *self.cols.values()):
+            line.sort()
+        self.extra: Optional[complex] = None
+
+    def __contains__(self, position: complex) -> bool:
+        return position == self.extra or position in self.obstacles
+
+    def extra_ahead(self, position: complex, direction: Direction) -> bool:
+        """Whether the extra obstacle is straight ahead of position"""
+        if self.extra is None:
+            return False
+        # Project the offset onto the direction of travel
+        along = (self.extra - position) * direction.value.conjugate()
+        return along.imag == 0 and along.real > 0
+
+    def ahead(self, position: complex, direction: Direction) -> bool:
+        """Whether there is any obstacle from position in the direction of travel"""
+        x, y = int(position.real), int(position.imag)
+        match direction:
+            case Direction.UP:
+                found = x in self.cols and self.cols[x][0] < y
+            case Direction.DOWN:
+                found = x in self.cols and self.cols[x][-1] > y
+            case Direction.LEFT:
+                found = y in self.rows and self.rows[y][0] < x
+            case Direction.RIGHT:
+                found = y in self.rows and self.rows[y][-1] > x
+        return found or self.extra_ahead(position, direction)
+
+    def casts(self, rays: Iterable[tuple[complex, Direction]]) -> list[bool]:
+        """
+        Whether there is any obstacle ahead of each ray along a whole path
+
+        The ends of every row and column are gathered once, so each ray is
+        a single dict lookup and comparison.
+        """
+        top = {x: line[0] for x, line in self.cols.items()}
+        bottom = {x: line[-1] for x, line in self.cols.items()}
+        left = {y: line[0] for y, line in self.rows.items()}
+        right = {y: line[-1] for y, line in self.rows.items()}
+        answers = []
+        for position, direction in rays:
+            x, y = int(position.real), int(position.imag)
+            # A missing line defaults to the ray's own coordinate, which is never ahead
+            if direction is Direction.UP:
+                found = top.get(x, y) < y
+            elif direction is Direction.DOWN:
+                found = bottom.get(x, y) > y
+            elif direction is Direction.LEFT:
+                found = left.get(y, x) < x
+            else:
+                found = right.get(y, x) > x
+            answers.append(found or self.extra_ahead(position, direction))
+        return answers
+
+    @staticmethod
+    def nearest(line: list[int], coord: int, forwards: bool) -> Optional[int]:
+        """The closest entry of a sorted line strictly after (or before) coord"""
+        if forwards:
+            i = bisect_left(line, coord + 1)
+            return line[i] if i < len(line) else None
+        i = bisect_left(line, coord)
+        return line[i - 1] if i else None
+
+    def next_obstacle(self, position: complex, direction: Direction) -> Optional[complex]:
+        """The closest obstacle from position in the direction of travel, if there is one"""
+        x, y = int(position.real), int(position.imag)
+        forwards = direction in (Direction.DOWN, Direction.RIGHT)
+        if direction in (Direction.UP, Direction.DOWN):
+            hit = self.nearest(self.cols.get(x, []), y, forwards)
+            # Check if the extra obstacle is in the way first
+            if self.extra is not None and self.extra.real == x:
+                e = int(self.extra.imag)
+                if (e > y if forwards else e < y) and (hit is None or (e < hit if forwards else e > hit)):
+                    hit = e
+            return None if hit is None else complex(x, hit)
+
+        hit = self.nearest(self.rows.get(y, []), x, forwards)
+        if self.extra is not None and self.extra.imag == y:
+            e = int(self.extra.real)
+            if (e > x if forwards else e < x) and (hit is None or (e < hit if forwards else e > hit)):
+                hit = e
+        return None if hit is None else complex(hit, y)
+
+    def detect_loop(
+            self, position: complex, direction: Direction, bounds: complex, turns: Optional[StateStore] = None,
+    ) -> bool:
+        """
+        Return True if a guard starting here would patrol in a loop
+
+        The guard jumps straight from turn point to turn point, so it's a loop
+        as soon as it stops in front of the same obstacle facing the same way.
+        A StateStore can be passed in to be reused between checks.
+        """
+        if turns is None:
+            turns = StateStore(int(bounds.real), int(bounds.imag))
+        else:
+            turns.reset()
+        while True:
+            obstacle = self.next_obstacle(position, direction)
+            if obstacle is None:
+                return False
+            position = obstacle - direction.value
+            # The guard walks out of bounds before reaching the obstacle
+            if not ((0 <= position.real < bounds.real) and (0 <= position.imag < bounds.imag)):
+                return False
+            if turns.visit(position, direction):
+                return True
+            direction = direction.turn()
+
 
 def parse(file: TextIO):
     """Parse the plaintext input"""
@@ -123,30 +307,89 @@ def part_one(guard: Guard, obstacles: set[complex], bounds: complex):
     return len(visited), loops
 
 
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
+def loop_candidates(guard: Guard, index: ObstacleIndex, bounds: complex):
+    """
+    Walk the guard's route, returning the number of positions visited and the candidates
+
+    A candidate is the guard's position and direction just before stepping
+    onto a new position that would send it towards an obstacle if blocked.
+    """
+    route = guard.route(index, bounds)
+    casts = index.casts((position, direction.turn()) for position, direction in route)
+    visited: set[complex] = set()
+    candidates: list[tuple[complex, Direction]] = []
+
+    for (position, direction), cast in zip(route, casts):
+        visited.add(position)
+        if cast and position + direction.value not in visited:
+            candidates.append((position, direction))
+
+    return len(visited), candidates
+
+
+def count_loops(index: ObstacleIndex, candidates: list[tuple[complex, Direction]], bounds: complex) -> int:
+    """Count the candidates that trap the guard in a loop when blocked"""
+    turns = StateStore(int(bounds.real), int(bounds.imag))
+    loops = 0
+    for position, direction in candidates:
+        index.extra = position + direction.value
+        loops += index.detect_loop(position, direction, bounds, turns)
+    index.extra = None
+    return loops
+
+
+def part_one_jump(guard: Guard, obstacles: set[complex], bounds: complex):
+    """
+    Solution to part one and two, checking candidates with jumps
+
+    Same walk as part_one, but every cast along the route is answered in
+    one batch by an ObstacleIndex, and each candidate loop check jumps
+    between turn points with the candidate as the index's extra obstacle.
+    """
+    index = ObstacleIndex(obstacles)
+    visited, candidates = loop_candidates(guard, index, bounds)
+    return visited, count_loops(index, candidates, bounds)
+
+
+# Each worker process builds its own index once
+_worker_index: Optional[ObstacleIndex] = None
+
+
+def _init_worker(obstacles: set[complex]):
+    global _worker_index  # pylint: disable=global-statement
+    _worker_index = ObstacleIndex(obstacles)
+
+
+def _count_chunk(candidates: list[tuple[complex, Direction]], bounds: complex) -> int:
+    assert _worker_index is not None, "Worker not initialised"
+    return count_loops(_worker_index, candidates, bounds)
+
+
+def part_one_parallel(
+        guard: Guard, obstacles: set[complex], bounds: complex,
+        workers: Optional[int] = None, chunks_per_worker: int = 4,
+):
+    """
+    Solution to part one and two, checking candidates across a process pool
+
+    The jump loop check only needs the obstacles, not the route walked so
+    far, so the obstacles are sent to each worker once and the candidates
+    are fanned out in chunks.
+    """
+    index = ObstacleIndex(obstacles)
+    visited, candidates = loop_candidates(guard, index, bounds)
+    workers = workers or os.cpu_count() or 1
+    size = max(1, -(-len(candidates) // (workers * chunks_per_worker)))
+    chunks = [candidates[i:i+size] for i in range(0, len(candidates), size)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(obstacles,)) as pool:
+        loops = sum(pool.map(_count_chunk, chunks, [bounds] * len(chunks)))
 
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        guard, obstacles, bounds = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
+    return visited, loops
 
-    # Part One
-    print(":: Part One + Two ::")
-    t1 = -time.time()
-    a1, a2 = part_one(guard, obstacles, bounds)
-    t1 += time.time()
-    print(f"Part One Answer: {a1}")
-    print(f"Part Two Answer: {a2}")
-    print(f"runtime: {t1: .4f}s")
 
-    print(f":: total runtime: {t0+t1: .4f}s ::")
+solution = register(Solution(DAY, parse, part_one_jump, fused=True, unpack=True, mutates=True))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
@@ -1,9 +1,59 @@
 """AoC :: Day 7"""
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+import os
+import sys
 import time
-from typing import TextIO
+from typing import Callable, Optional, TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 7
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
+
+
+@dataclass(frozen=True)
+class Operator:
+    """
+    An operator as used when searching backwards from the test value
+
+    undo(target, n) returns the value that the operator would have to be
+    applied to, with n, to make target, or None if no value can.
+    """
+    name: str
+    undo: Callable[[int, int], Optional[int]]
+
+
+def power_of_ten_above(n: int) -> int:
+    """The smallest power of ten greater than n, i.e. what concatenating n shifts by"""
+    p = 10
+    while p <= n:
+        p *= 10
+    return p
+
+
+def undo_add(target: int, n: int) -> Optional[int]:
+    """Undo + by subtracting"""
+    return target - n if target >= n else None
+
+
+def undo_mul(target: int, n: int) -> Optional[int]:
+    """Undo * if target is divisible by n"""
+    return target // n if n and not target % n else None
+
+
+def undo_concat(target: int, n: int) -> Optional[int]:
+    """Undo || if target ends in the digits of n"""
+    p = power_of_ten_above(n)
+    return target // p if target % p == n else None
+
+
+ADD = Operator("+", undo_add)
+MUL = Operator("*", undo_mul)
+CONCAT = Operator("||", undo_concat)
+
+# Cheapest to rule out first
+PART_ONE_OPERATORS = (MUL, ADD)
+PART_TWO_OPERATORS = (CONCAT, MUL, ADD)
 
 
 @dataclass
@@ -59,6 +109,97 @@ class Equation:
 
         return recurse(self.test_value, self.numbers[0], 1)
 
+    def solvable(self, operators: tuple[Operator, ...] = PART_TWO_OPERATORS) -> bool:
+        """
+        determine if a test value is achievable by searching backwards from it
+
+        Each operator undoes the last number, and most targets can't be
+        undone by * or || at all, so branches die much earlier than going forwards.
+        """
+        numbers = self.numbers
+
+        def search(target: int, idx: int) -> bool:
+            """Whether numbers[:idx+1] can make target"""
+            if not idx:
+                return target == numbers[0]
+            n = numbers[idx]
+            for operator in operators:
+                previous = operator.undo(target, n)
+                if previous is not None and search(previous, idx - 1):
+                    return True
+            return False
+
+        return search(self.test_value, len(numbers) - 1)
+
+
+class SolveCache:
+    """
+    A bounded LRU memo of backwards search results, shared between equations
+
+    Results are keyed on (sequence id, target). The sequence id names the
+    numbers still to be undone, numbers[:idx+1]. Ids are interned one number
+    at a time, so equations that start with the same numbers share their
+    sub-problems.
+    """
+    def __init__(self, operators: tuple[Operator, ...] = PART_TWO_OPERATORS, max_size: int = 2**16):
+        self.operators = operators
+        self.max_size = max_size
+        self.entries: OrderedDict[tuple[int, int], bool] = OrderedDict()
+        self.ids: dict[tuple[int, int], int] = {}
+        self.hits = self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups answered from the cache"""
+        return self.hits / max(self.hits + self.misses, 1)
+
+    def stats(self) -> str:
+        """A summary of how well the cache is doing"""
+        return (
+            f"hits: {self.hits} | misses: {self.misses} | hit rate: {self.hit_rate:.1%}"
+            f" | entries: {len(self.entries)}/{self.max_size}"
+        )
+
+    def sequence_ids(self, numbers: list[int]) -> list[int]:
+        """The id of every prefix of numbers"""
+        ids = []
+        parent = -1
+        for n in numbers:
+            parent = self.ids.setdefault((parent, n), len(self.ids))
+            ids.append(parent)
+        return ids
+
+    def solvable(self, eq: Equation) -> bool:
+        """Equation.solvable, remembering the result of every sub-problem"""
+        numbers = eq.numbers
+        ids = self.sequence_ids(numbers)
+        entries = self.entries
+
+        def search(target: int, idx: int) -> bool:
+            """Whether numbers[:idx+1] can make target"""
+            if not idx:
+                return target == numbers[0]
+            key = (ids[idx], target)
+            if key in entries:
+                self.hits += 1
+                entries.move_to_end(key)
+                return entries[key]
+            self.misses += 1
+            n = numbers[idx]
+            result = False
+            for operator in self.operators:
+                previous = operator.undo(target, n)
+                if previous is not None and search(previous, idx - 1):
+                    result = True
+                    break
+            entries[key] = result
+            if len(entries) > self.max_size:
+                entries.popitem(last=False)
+            return result
+
+        return search(eq.test_value, len(numbers) - 1)
+
+
 def parse(file: TextIO):
     """Parse the plaintext input"""
     return [Equation.parse(i[:-1]) for i in file.readlines()]
@@ -74,36 +215,80 @@ def part_two(inputs: list[Equation]):
     return sum(eq.test_value for eq in inputs if eq.valid2())
 
 
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
-
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        inputs = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
-
-    # Part One
-    print(":: Part One ::")
-    t1 = -time.time()
-    a1 = part_one(inputs)
-    t1 += time.time()
-    print(f"Answer: {a1}")
-    print(f"runtime: {t1: .4f}s")
-
-    # Part Two
-    print(":: Part Two ::")
-    t2 = -time.time()
-    a2 = part_two(inputs)
-    t2 += time.time()
-    print(f"Answer: {a2}")
-    print(f"runtime: {t2: .4f}s")
-    print(f":: total runtime: {t0+t1+t2: .4f}s ::")
+def part_one_reverse(inputs: list[Equation]):
+    """Solution to part one, searching backwards"""
+    return sum(eq.test_value for eq in inputs if eq.solvable(PART_ONE_OPERATORS))
+
+
+def part_two_reverse(inputs: list[Equation]):
+    """Solution to part two, searching backwards"""
+    return sum(eq.test_value for eq in inputs if eq.solvable(PART_TWO_OPERATORS))
+
+
+def part_two_memo(inputs: list[Equation], cache: Optional[SolveCache] = None):
+    """Solution to part two, searching backwards through a shared cache"""
+    cache = cache or SolveCache(PART_TWO_OPERATORS)
+    return sum(eq.test_value for eq in inputs if cache.solvable(eq))
+
+
+@dataclass
+class ChunkResult:
+    """The totals for a chunk of equations and how long it took to solve"""
+    part_one: int
+    part_two: int
+    equations: int
+    seconds: float
+
+
+def solve_chunk(equations: list[Equation]) -> ChunkResult:
+    """
+    Solve both parts for a chunk of equations in a single pass
+
+    Anything part one can make, part two can too, so part two only
+    searches the equations part one couldn't solve.
+    """
+    t = -time.perf_counter()
+    one = two = 0
+    for eq in equations:
+        if eq.solvable(PART_ONE_OPERATORS):
+            one += eq.test_value
+            two += eq.test_value
+        elif eq.solvable(PART_TWO_OPERATORS):
+            two += eq.test_value
+    t += time.perf_counter()
+    return ChunkResult(one, two, len(equations), t)
+
+
+def solve_batch(
+        equations: list[Equation], chunk_size: int = 2_000, workers: Optional[int] = None,
+) -> list[ChunkResult]:
+    """
+    Solve equations in chunks across a process pool
+
+    A single chunk is solved in process, since starting a pool would take
+    longer than solving it.
+    """
+    chunks = [equations[i:i+chunk_size] for i in range(0, len(equations), chunk_size)]
+    if len(chunks) <= 1:
+        return [solve_chunk(chunk) for chunk in chunks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(solve_chunk, chunks))
+
+
+def report(results: list[ChunkResult]):
+    """Print the timing of each chunk"""
+    for i, result in enumerate(results):
+        print(f"chunk {i}: {result.equations} equations | runtime: {result.seconds: .4f}s")
+
+
+def part_one_batch(inputs: list[Equation]):
+    """Solution to part one and two in a single batched pass"""
+    results = solve_batch(inputs)
+    return sum(r.part_one for r in results), sum(r.part_two for r in results)
+
+
+solution = register(Solution(DAY, parse, part_one_batch, fused=True))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
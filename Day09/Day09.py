@@ -1,8 +1,62 @@
 """AoC :: Day 9"""
-import time
-from typing import TextIO
+from array import array
+from dataclasses import dataclass
+import heapq
+from itertools import accumulate, islice
+from math import inf
+import mmap
+import os
+import sys
+from typing import BinaryIO, Iterator, TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 9
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
+
+# Translation table from ascii digits to their values
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+# Bytes of input decoded at a time
+CHUNK = 2**20
+
+
+@dataclass
+class Disk:
+    """
+    A disk map decoded once into a byte per digit
+
+    sizes alternates between file and gap sizes just like the disk map,
+    and files and gaps are zero-copy strided views of it.
+    """
+    sizes: array
+
+    @classmethod
+    def decode(cls, data: "str | bytes | mmap.mmap") -> "Disk":
+        """Decode a disk map a chunk at a time, so a memory-mapped map is never read into one str"""
+        if isinstance(data, str):
+            data = data.encode()
+        sizes = array('B')
+        for offset in range(0, len(data), CHUNK):
+            sizes.frombytes(data[offset:offset+CHUNK].translate(DIGITS, b" \r\n"))
+        return cls(sizes)
+
+    @classmethod
+    def load(cls, path: str) -> "Disk":
+        """Decode a disk map file through a memory map"""
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return cls.decode(mm)
+
+    @property
+    def files(self) -> memoryview:
+        """The size of each file by id"""
+        return memoryview(self.sizes)[0::2]
+
+    @property
+    def gaps(self) -> memoryview:
+        """The size of the gap after each file"""
+        return memoryview(self.sizes)[1::2]
+
+    def starts(self) -> array:
+        """The offset of every file and gap"""
+        return array('Q', accumulate(self.sizes, initial=0))
 
 
 def parse(file: TextIO):
@@ -10,12 +64,30 @@ def parse(file: TextIO):
     return file.read().strip()
 
 
+def parse_disk(file: TextIO):
+    """Parse the plaintext input into a Disk, memory mapping it if it is a real file"""
+    try:
+        fd = file.fileno()
+    except OSError:
+        return Disk.decode(file.read())
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        return Disk.decode(mm)
+
+
 def triangle(start: int, stop: int):
     """return the triangle number starting and stopping somewhere"""
     n = stop - start
     return n * start + n * (n - 1) // 2
 
 
+def checksum_of(file_ids, starts, sizes) -> int:
+    """The checksum of whole files in one pass of triangle sums"""
+    return sum(
+        file_id * (size * start + size * (size - 1) // 2)
+        for file_id, start, size in zip(file_ids, starts, sizes)
+    )
+
+
 def part_one(diskmap: str):
     """Solution to part one"""
     # Init for loop
@@ -99,36 +171,156 @@ def part_two(diskmap: str):
     return checksum
 
 
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
-
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        inputs = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
-
-    # Part One
-    print(":: Part One ::")
-    t1 = -time.time()
-    a1 = part_one(inputs)
-    t1 += time.time()
-    print(f"Answer: {a1}")
-    print(f"runtime: {t1: .4f}s")
-
-    # Part Two
-    print(":: Part Two ::")
-    t2 = -time.time()
-    a2 = part_two(inputs)
-    t2 += time.time()
-    print(f"Answer: {a2}")
-    print(f"runtime: {t2: .4f}s")
-    print(f":: total runtime: {t0+t1+t2: .4f}s ::")
+def part_one_disk(disk: Disk):
+    """
+    Solution to part one over a Disk
+
+    Files are taken whole from the front and fragments of files from the
+    back fill each gap, as in part_one.
+    """
+    files, gaps = disk.files, disk.gaps
+    checksum = position = 0
+    back = len(files) - 1
+    remaining = files[back]
+
+    front = 0
+    while front < back:
+        size = files[front]
+        checksum += front * triangle(position, position + size)
+        position += size
+        gap = gaps[front]
+        while gap and front < back:
+            if not remaining:
+                back -= 1
+                remaining = files[back]
+                continue
+            b = min(gap, remaining)
+            checksum += back * triangle(position, position + b)
+            position += b
+            gap -= b
+            remaining -= b
+        front += 1
+
+    # Whatever is left of the last file sits after everything else
+    if front == back:
+        checksum += back * triangle(position, position + remaining)
+    return checksum
+
+
+def digits_forwards(file: BinaryIO, start: int, stop: int) -> Iterator[int]:
+    """The digits of a file from start up to stop, read a chunk at a time"""
+    position = start
+    while position < stop:
+        file.seek(position)
+        chunk = file.read(min(CHUNK, stop - position))
+        if not chunk:
+            return
+        position += len(chunk)
+        yield from chunk.translate(DIGITS)
+
+
+def digits_backwards(file: BinaryIO, start: int, stop: int) -> Iterator[int]:
+    """The digits of a file from stop back down to start, read a chunk at a time"""
+    position = stop
+    while position > start:
+        size = min(CHUNK, position - start)
+        position -= size
+        file.seek(position)
+        yield from reversed(file.read(size).translate(DIGITS))
+
+
+def part_one_stream(file: BinaryIO):
+    """
+    Solution to part one streamed from a binary file
+
+    The front of the disk map is read forwards and the back of it backwards,
+    one chunk at a time each, so memory use doesn't grow with the map.
+    """
+    file.seek(0, os.SEEK_END)
+    end = file.tell()
+    # Ignore trailing whitespace
+    while end:
+        file.seek(end - 1)
+        if file.read(1) not in b" \r\n":
+            break
+        end -= 1
+    if not end:
+        return 0
+
+    last = (end - 1) // 2
+    front_digits = digits_forwards(file, 0, end)
+    # Every other digit from the last file backwards is a file size
+    back_files = islice(digits_backwards(file, 0, last * 2 + 1), 0, None, 2)
+    checksum = position = 0
+    back = last
+    remaining = next(back_files)
+
+    front = 0
+    while front < back:
+        size = next(front_digits)
+        checksum += front * triangle(position, position + size)
+        position += size
+        gap = next(front_digits)
+        while gap and front < back:
+            if not remaining:
+                back -= 1
+                remaining = next(back_files)
+                continue
+            b = min(gap, remaining)
+            checksum += back * triangle(position, position + b)
+            position += b
+            gap -= b
+            remaining -= b
+        front += 1
+
+    # Whatever is left of the last file sits after everything else
+    if front == back:
+        checksum += back * triangle(position, position + remaining)
+    return checksum
+
+
+def part_two_heaps(disk: Disk):
+    """
+    Solution to part two, placing each file from a free-space index
+
+    heaps[size] holds the start of every gap of that size, so the leftmost
+    gap a file fits in is the smallest top of the heaps of at least its
+    size. Whatever is left of the gap goes back on the heap of its new size.
+    Files are placed from the highest id down and their final starts are
+    summed up at the end.
+    """
+    files, gaps = disk.files, disk.gaps
+    starts = disk.starts()
+    file_starts = starts[0::2]
+    heaps: list[list[int]] = [[] for _ in range(10)]
+    for gap_start, gap_size in zip(starts[1::2], gaps):
+        heaps[gap_size].append(gap_start)
+    heaps[0].clear()
+    # Gaps were added left to right so each heap is already sorted
+    tops = [heap[0] if heap else inf for heap in heaps]
+    # Once a file of some size finds no gap, no file further left can fit a gap that big either
+    limit = 10
+
+    for file_id in range(len(files) - 1, -1, -1):
+        size = files[file_id]
+        if size < limit:
+            gap_size = min(range(size, limit), key=tops.__getitem__)
+            if tops[gap_size] < file_starts[file_id]:
+                heap = heaps[gap_size]
+                file_starts[file_id] = start = heapq.heappop(heap)
+                tops[gap_size] = heap[0] if heap else inf
+                if gap_size > size:
+                    heap = heaps[gap_size - size]
+                    heapq.heappush(heap, start + size)
+                    tops[gap_size - size] = heap[0]
+            elif size:
+                limit = size
+
+    return checksum_of(range(len(files)), file_starts, files)
+
+
+solution = register(Solution(DAY, parse_disk, part_one_disk, part_two_heaps))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
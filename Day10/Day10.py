@@ -1,8 +1,16 @@
 """AoC :: Day 10"""
-import time
+import os
+import sys
 from typing import TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 10
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
+
+# Heights as bytes, with line ends and impassable cells as a height nothing can climb to
+HEIGHTS = bytes.maketrans(b"0123456789\n.", bytes(range(10)) + b"\xff\xff")
+# Summits are never further than this from a cell on a trail to them
+REACH = 9
+WINDOW = 2 * REACH + 1
 
 class Topography(dict[complex, int]):
     """
@@ -78,6 +86,62 @@ def parse(file: TextIO, trailhead: int = 0):
     return tmap, trailheads
 
 
+def parse_heights(file: TextIO):
+    """
+    Parse the plaintext input into a flat array of heights
+
+    Each row keeps its line end, so stepping off either side of a row
+    lands on a cell that can't be climbed to.
+    """
+    rows = [row.strip() for row in file.readlines()]
+    heights = "".join(row + "\n" for row in rows).encode().translate(HEIGHTS)
+    return heights, len(rows[0]) if rows else 0
+
+
+def part_one_levels(heights: bytes, width: int, summit: int = 9):
+    """
+    Solution to part one and two in one sweep down the heights
+
+    Every cell of a level gets the number of trails from it and the set of
+    summits it reaches, both summed up from its uphill neighbours on the
+    level above. Only the level above is ever kept. Summits are at most
+    REACH steps away, so a summit set is a bitset over the WINDOW x WINDOW
+    square around the cell, and moving to a neighbour is a shift.
+    """
+    stride = width + 1
+    # Neighbour offsets in the array and the shift to re-centre their summit bits
+    steps = ((1, 1), (-1, -1), (stride, WINDOW), (-stride, -WINDOW))
+
+    levels: list[list[int]] = []
+    for height in range(summit + 1):
+        cells = []
+        i = heights.find(height)
+        while i != -1:
+            cells.append(i)
+            i = heights.find(height, i + 1)
+        levels.append(cells)
+
+    centre = 1 << (REACH * WINDOW + REACH)
+    trails = {i: 1 for i in levels[summit]}
+    summits = {i: centre for i in levels[summit]}
+    for cells in reversed(levels[:summit]):
+        next_trails: dict[int, int] = {}
+        next_summits: dict[int, int] = {}
+        for i in cells:
+            count = reached = 0
+            for step, shift in steps:
+                j = i + step
+                if j in trails:
+                    count += trails[j]
+                    reached |= summits[j] << shift if shift > 0 else summits[j] >> -shift
+            if count:
+                next_trails[i] = count
+                next_summits[i] = reached
+        trails, summits = next_trails, next_summits
+
+    return sum(reached.bit_count() for reached in summits.values()), sum(trails.values())
+
+
 def part_one(tmap: Topography, trailheads: set[complex]):
     """Solution to part one"""
     return sum(tmap.count_summits(trailhead) for trailhead in trailheads)
@@ -88,36 +152,8 @@ def part_two(tmap: Topography, trailheads: set[complex]):
     return sum(tmap.count_trails(trailhead) for trailhead in trailheads)
 
 
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
-
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        tmap, trailheads = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
-
-    # Part One
-    print(":: Part One ::")
-    t1 = -time.time()
-    a1 = part_one(tmap, trailheads)
-    t1 += time.time()
-    print(f"Answer: {a1}")
-    print(f"runtime: {t1: .4f}s")
-
-    # Part Two
-    print(":: Part Two ::")
-    t2 = -time.time()
-    a2 = part_two(tmap, trailheads)
-    t2 += time.time()
-    print(f"Answer: {a2}")
-    print(f"runtime: {t2: .4f}s")
-    print(f":: total runtime: {t0+t1+t2: .4f}s ::")
+solution = register(Solution(DAY, parse_heights, part_one_levels, fused=True, unpack=True))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
@@ -1,8 +1,61 @@
 """AoC :: Day 11"""
-import time
-from typing import TextIO
+from bisect import bisect_right
+import os
+import sys
+from typing import Iterable, Optional, TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 11
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
+
+# Powers of ten for counting and splitting digits, extended as needed
+POWERS_OF_TEN = [10**i for i in range(20)]
+
+
+def digit_count(n: int) -> int:
+    """The number of digits in a positive integer"""
+    while POWERS_OF_TEN[-1] <= n:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return bisect_right(POWERS_OF_TEN, n)
+
+
+class Transitions:
+    """
+    A cache of what each stone becomes after one blink
+
+    Rules are worked out arithmetically, splitting on a power of ten rather
+    than converting to strings. The cache lives as long as the instance, so
+    the module-level TRANSITIONS is shared by every blink of every run.
+    """
+    def __init__(self):
+        self.children: dict[int, tuple[int, ...]] = {}
+        self.hits = self.misses = 0
+
+    def __call__(self, stone: int) -> tuple[int, ...]:
+        children = self.children.get(stone)
+        if children is not None:
+            self.hits += 1
+            return children
+        self.misses += 1
+        if stone == 0:
+            children = (1,)
+        elif not (digits := digit_count(stone)) % 2:
+            children = divmod(stone, POWERS_OF_TEN[digits // 2])
+        else:
+            children = (stone * 2024,)
+        self.children[stone] = children
+        return children
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups answered from the cache"""
+        return self.hits / max(self.hits + self.misses, 1)
+
+    def stats(self) -> str:
+        """A summary of how well the cache is doing"""
+        return f"hits: {self.hits} | misses: {self.misses} | hit rate: {self.hit_rate:.1%}"
+
+
+TRANSITIONS = Transitions()
 
 
 class Pebbles(dict[int, int]):
@@ -38,6 +91,129 @@ class Pebbles(dict[int, int]):
                 next_state.increase(key * 2024, val)
         return next_state
 
+    def blink_cached(self, transitions: Transitions = TRANSITIONS):
+        """blink, looking up each stone's rule in a transition cache"""
+        next_state = Pebbles()
+        for key, val in self.items():
+            for child in transitions(key):
+                next_state[child] = next_state.get(child, 0) + val
+        return next_state
+
+
+class BlinkCounter:
+    """
+    How many stones one stone becomes after some blinks, memoised on (stone, blinks)
+
+    The memo is kept as levels[blinks][stone] and filled bottom up, a whole
+    level of the closed set of reachable stones at a time, so thousands of
+    blinks don't recurse. Counts can be kept modulo some number for very
+    many blinks.
+    """
+    def __init__(self, transitions: Transitions = TRANSITIONS, modulus: Optional[int] = None):
+        self.transitions = transitions
+        self.modulus = modulus
+        self.levels: list[dict[int, int]] = [{}]
+
+    def fill(self, stones: Iterable[int], blinks: int):
+        """Memoise every stone reachable from stones for up to blinks blinks"""
+        known = self.levels[0]
+        # Known stones are already closed under blinking
+        new: list[int] = []
+        todo = [stone for stone in stones if stone not in known]
+        while todo:
+            stone = todo.pop()
+            if stone not in known:
+                known[stone] = 1
+                new.append(stone)
+                todo.extend(self.transitions(stone))
+
+        # New stones go in every level that already exists, not just up to blinks
+        for n in range(1, max(blinks, len(self.levels) - 1) + 1):
+            if n == len(self.levels):
+                self.levels.append({})
+                stones_to_fill: Iterable[int] = known
+            else:
+                stones_to_fill = new
+            previous, level = self.levels[n - 1], self.levels[n]
+            for stone in stones_to_fill:
+                total = sum(previous[child] for child in self.transitions(stone))
+                level[stone] = total % self.modulus if self.modulus else total
+
+    def count_after(self, stone: int, blinks: int) -> int:
+        """The number of stones stone becomes after blinks blinks"""
+        self.fill([stone], blinks)
+        return self.levels[blinks][stone]
+
+    def total(self, pebbles: Pebbles, blinks: int) -> int:
+        """The number of stones all the pebbles become"""
+        self.fill(pebbles, blinks)
+        level = self.levels[blinks]
+        total = sum(count * level[stone] for stone, count in pebbles.items())
+        return total % self.modulus if self.modulus else total
+
+
+class TransitionMatrix:
+    """
+    A blink as a sparse linear operator over the closed set of reachable stones
+
+    rows[i][j] is how many stones values[j] a single values[i] becomes in a
+    blink, so the row sums of the matrix to the power n are how many
+    stones each value becomes after n blinks. Squaring makes that log n
+    matrix products. They get dense, so this suits small closed sets
+    (single digits reach only 54 values) rather than the thousands of
+    values a real input reaches.
+    """
+    def __init__(
+            self, stones: Iterable[int], transitions: Transitions = TRANSITIONS, modulus: Optional[int] = None,
+    ):
+        self.modulus = modulus
+        self.values: list[int] = []
+        self.index: dict[int, int] = {}
+        todo = list(stones)
+        while todo:
+            stone = todo.pop()
+            if stone not in self.index:
+                self.index[stone] = len(self.values)
+                self.values.append(stone)
+                todo.extend(transitions(stone))
+        self.rows: list[dict[int, int]] = []
+        for stone in self.values:
+            row: dict[int, int] = {}
+            for child in transitions(stone):
+                row[self.index[child]] = row.get(self.index[child], 0) + 1
+            self.rows.append(row)
+
+    def multiply(self, a: list[dict[int, int]], b: list[dict[int, int]]) -> list[dict[int, int]]:
+        """The product of two sparse matrices"""
+        product = []
+        for row_a in a:
+            row: dict[int, int] = {}
+            for k, x in row_a.items():
+                for j, y in b[k].items():
+                    row[j] = row.get(j, 0) + x * y
+            if self.modulus:
+                row = {j: v % self.modulus for j, v in row.items() if v % self.modulus}
+            product.append(row)
+        return product
+
+    def power(self, n: int) -> list[dict[int, int]]:
+        """The matrix to the power n"""
+        result: list[dict[int, int]] = [{i: 1} for i in range(len(self.values))]
+        base = self.rows
+        while n:
+            if n & 1:
+                result = self.multiply(result, base)
+            n >>= 1
+            if n:
+                base = self.multiply(base, base)
+        return result
+
+    def total(self, pebbles: Pebbles, blinks: int) -> int:
+        """The number of stones all the pebbles become"""
+        rows = self.power(blinks)
+        total = sum(count * sum(rows[self.index[stone]].values()) for stone, count in pebbles.items())
+        return total % self.modulus if self.modulus else total
+
 
 def parse(file: TextIO):
     """Parse the plaintext input"""
@@ -51,40 +227,38 @@ def part_one(pebbles: Pebbles, blinks: int = 25):
     """Solution to part one"""
     for _ in range(blinks):
         pebbles = pebbles.blink()
-    return sum(pebbles.values()), pebbles
-
-
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
-
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        inputs = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
-
-    # Part One
-    print(":: Part One ::")
-    t1 = -time.time()
-    a1, outputs = part_one(inputs)
-    t1 += time.time()
-    print(f"Answer: {a1}")
-    print(f"runtime: {t1: .4f}s")
-
-    # Part Two
-    print(":: Part Two ::")
-    t2 = -time.time()
-    # Do 50 more steps on top of part one
-    a2, _ = part_one(outputs, 50)
-    t2 += time.time()
-    print(f"Answer: {a2}")
-    print(f"runtime: {t2: .4f}s")
-    print(f":: total runtime: {t0+t1+t2: .4f}s ::")
+    return sum(pebbles.values())
+
+
+def part_two(pebbles: Pebbles, blinks: int = 75):
+    """Solution to part two"""
+    return part_one(pebbles, blinks)
+
+
+def part_one_cached(pebbles: Pebbles, blinks: int = 25, transitions: Transitions = TRANSITIONS):
+    """Solution to part one, with cached transitions"""
+    for _ in range(blinks):
+        pebbles = pebbles.blink_cached(transitions)
+    return sum(pebbles.values())
+
+
+def part_two_cached(pebbles: Pebbles, blinks: int = 75, transitions: Transitions = TRANSITIONS):
+    """Solution to part two, with cached transitions"""
+    return part_one_cached(pebbles, blinks, transitions)
+
+
+def part_two_count(pebbles: Pebbles, blinks: int = 75):
+    """Solution to part two, counting each stone's descendants from a memo"""
+    return BlinkCounter().total(pebbles, blinks)
+
+
+def part_two_matrix(pebbles: Pebbles, blinks: int = 75):
+    """Solution to part two, raising the transition matrix to the power of the blinks"""
+    return TransitionMatrix(pebbles).total(pebbles, blinks)
+
+
+solution = register(Solution(DAY, parse, part_one_cached, part_two_cached))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
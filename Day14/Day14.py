@@ -1,11 +1,15 @@
 """AoC :: Day 14"""
+from array import array
+from collections import Counter
 from dataclasses import dataclass
 import math
+import os
 import re
-import time
-from typing import TextIO
+import sys
+from typing import Callable, TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 14
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
 
 
 # Constants defined in the problem description
@@ -58,6 +62,108 @@ class Robot:
         return cls(position, velocity)
 
 
+class Swarm:
+    """
+    Every robot's position and velocity in flat integer arrays
+
+    Robots move independently and wrap around the lobby, so the swarm at
+    any time t is worked out directly as (p + v*t) mod dims rather than by
+    stepping. Velocities are stored modulo the lobby to keep the sums small.
+    """
+    def __init__(self, robots: list[Robot], dims: complex = LOBBY_DIMS):
+        self.width, self.height = int(dims.real), int(dims.imag)
+        self.px = array('q', (int(r.position.real) for r in robots))
+        self.py = array('q', (int(r.position.imag) for r in robots))
+        self.vx = array('q', (int(r.velocity.real) % self.width for r in robots))
+        self.vy = array('q', (int(r.velocity.imag) % self.height for r in robots))
+
+    @classmethod
+    def parse(cls, file: TextIO, dims: complex = LOBBY_DIMS) -> 'Swarm':
+        """Parse the plaintext input straight into arrays"""
+        swarm = cls([], dims)
+        for match in re_robot.finditer(file.read()):
+            px, py, vx, vy = map(int, match.groups())
+            swarm.px.append(px)
+            swarm.py.append(py)
+            swarm.vx.append(vx % swarm.width)
+            swarm.vy.append(vy % swarm.height)
+        return swarm
+
+    def __len__(self) -> int:
+        return len(self.px)
+
+    def xs(self, t: int) -> list[int]:
+        """Every robot's x coordinate at time t"""
+        w, t = self.width, t % self.width
+        return [(p + v * t) % w for p, v in zip(self.px, self.vx)]
+
+    def ys(self, t: int) -> list[int]:
+        """Every robot's y coordinate at time t"""
+        h, t = self.height, t % self.height
+        return [(p + v * t) % h for p, v in zip(self.py, self.vy)]
+
+    def cells(self, t: int) -> list[int]:
+        """Every robot's position at time t as a cell index y*width+x"""
+        w = self.width
+        return [y * w + x for x, y in zip(self.xs(t), self.ys(t))]
+
+    def occupancy(self, t: int) -> Counter[int]:
+        """How many robots are on each occupied cell at time t"""
+        return Counter(self.cells(t))
+
+    def column_counts(self, t: int) -> list[int]:
+        """How many robots are in each column at time t"""
+        counts = [0] * self.width
+        for x in self.xs(t):
+            counts[x] += 1
+        return counts
+
+    def row_counts(self, t: int) -> list[int]:
+        """How many robots are in each row at time t"""
+        counts = [0] * self.height
+        for y in self.ys(t):
+            counts[y] += 1
+        return counts
+
+    def quadrant_counts(self, t: int) -> list[int]:
+        """How many robots are in each quadrant at time t, ignoring the centre lines"""
+        # Compare doubled coordinates with the doubled centre to stay in integers
+        cx, cy = self.width - 1, self.height - 1
+        counts = [0] * 4
+        for x, y in zip(self.xs(t), self.ys(t)):
+            if 2 * x != cx and 2 * y != cy:
+                counts[(2 * x > cx) + 2 * (2 * y > cy)] += 1
+        return counts
+
+
+def variance(coords: list[int]) -> float:
+    """How spread out some coordinates are, the picture being the least spread out"""
+    mean = sum(coords) / len(coords)
+    return sum((c - mean) ** 2 for c in coords) / len(coords)
+
+
+def crt(a: int, m: int, b: int, n: int) -> int:
+    """The smallest t >= 0 with t = a (mod m) and t = b (mod n), for any moduli"""
+    g = math.gcd(m, n)
+    if (b - a) % g:
+        raise ValueError(f"No time is {a} mod {m} and {b} mod {n}")
+    k = (b - a) // g * pow(m // g, -1, n // g) % (n // g)
+    return (a + m * k) % (m // g * n)
+
+
+def picture_time(swarm: Swarm, score: Callable[[list[int]], float] = variance) -> int:
+    """
+    The time the robots form a picture
+
+    x positions repeat every width steps and y positions every height
+    steps, so the best x phase and best y phase are found separately by
+    scoring each axis and combined with the Chinese Remainder Theorem.
+    """
+    tx = min(range(swarm.width), key=lambda t: score(swarm.xs(t)))
+    ty = min(range(swarm.height), key=lambda t: score(swarm.ys(t)))
+    return crt(tx, swarm.width, ty, swarm.height)
+
+
 def parse(file: TextIO):
     """Parse the plaintext input"""
     return [Robot.parse(i[:-1]) for i in file.readlines()]
@@ -86,36 +192,27 @@ def part_two(inputs: list[Robot]):
         i += 1
 
 
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
-
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        inputs = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
-
-    # Part One
-    print(":: Part One ::")
-    t1 = -time.time()
-    a1 = part_one(inputs)
-    t1 += time.time()
-    print(f"Answer: {a1}")
-    print(f"runtime: {t1: .4f}s")
-
-    # Part Two
-    print(":: Part Two ::")
-    t2 = -time.time()
-    a2 = part_two(inputs)
-    t2 += time.time()
-    print(f"Answer: {a2}")
-    print(f"runtime: {t2: .4f}s")
-    print(f":: total runtime: {t0+t1+t2: .4f}s ::")
+def part_one_swarm(swarm: Swarm):
+    """Solution to part one, in closed form"""
+    # Empty quadrants are left out of the product
+    return math.prod(count for count in swarm.quadrant_counts(100) if count)
+
+
+def part_two_swarm(swarm: Swarm):
+    """Solution to part two, checking each time for unique positions in closed form"""
+    t = 0
+    while len(set(swarm.cells(t))) != len(swarm):
+        t += 1
+    return t
+
+
+def part_two_crt(swarm: Swarm):
+    """Solution to part two, searching each axis over its own period"""
+    return picture_time(swarm)
+
+
+solution = register(Solution(DAY, Swarm.parse, part_one_swarm, part_two_crt))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
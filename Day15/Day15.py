@@ -1,8 +1,10 @@
 """AoC :: Day 15"""
-import time
+import os
+import sys
 from typing import TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
 DAY = 15
-INPUT_FILE = 'Day{day}/Day{day}.in'.format(day=str(DAY).zfill(2))
 
 
 def move_from_char(char: str) -> complex:
@@ -275,36 +277,14 @@ def part_two(warehouse: Warehouse2, movements: list[complex]):
     return warehouse.GPS_sum()
 
 
-# run both solutions and print outputs + runtime
-def main():
-    """The full days solution"""
-    print(f":: Advent of Code 2024 -- Day {DAY} ::")
-
-    # Parse inputs
-    print(":: Parsing Inputs ::")
-    t0 = -time.time()
-    with open(INPUT_FILE, encoding="utf8") as f:
-        warehouse, movements, warehouse_pt2 = parse(f)
-    t0 += time.time()
-    print(f"runtime: {t0: .4f}s")
-
-    # Part One
-    print(":: Part One ::")
-    t1 = -time.time()
-    a1 = part_one(warehouse, movements)
-    t1 += time.time()
-    print(f"Answer: {a1}")
-    print(f"runtime: {t1: .4f}s")
-
-    # Part Two
-    print(":: Part Two ::")
-    t2 = -time.time()
-    a2 = part_two(warehouse_pt2, movements)
-    t2 += time.time()
-    print(f"Answer: {a2}")
-    print(f"runtime: {t2: .4f}s")
-    print(f":: total runtime: {t0+t1+t2: .4f}s ::")
+# parse returns (warehouse, movements, warehouse_pt2) and each part has its own warehouse
+solution = register(Solution(
+    DAY, parse,
+    part_one=lambda inputs: part_one(inputs[0], inputs[1]),
+    part_two=lambda inputs: part_two(inputs[2], inputs[1]),
+    mutates=True,
+))
 
 
 if __name__ == "__main__":
-    main()
+    solution.main()
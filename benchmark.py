@@ -0,0 +1,272 @@
+"""
+Statistical benchmarks for each day
+
+Every phase (parsing, part one and part two) is run a number of warmup
+times and then timed repeatedly with perf_counter_ns. The inputs are
+rebuilt before every repeat for solutions that mutate their inputs in
+place (e.g. Day14.part_two and Day15.part_one), loading fresh copies from
+the parsed input cache where possible. A summary of the
+timings is written to DayNN/DayNN.bench.json, next to the .out file.
+
+Optionally each phase is also run once more under tracemalloc to record
+its peak memory, net allocations and change in resident set size.
+
+A sweep times each phase on synthetic inputs of increasing size (see
+generators.py) and fits the exponent k of an O(n^k) curve to the timings.
+"""
+import io
+import json
+import math
+import os
+import pickle
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import cache
+from generators import GENERATORS, generate
+from solution import ROOT, folder, get
+
+def percentile(samples: list[int], q: float) -> int:
+    """Nearest-rank percentile of some samples"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def summarise(samples: list[int]) -> dict[str, Any]:
+    """Summary statistics of a list of timings in nanoseconds"""
+    return {
+        "min_ns": min(samples),
+        "median_ns": int(statistics.median(samples)),
+        "p95_ns": percentile(samples, 0.95),
+        "stddev_ns": int(statistics.stdev(samples)) if len(samples) > 1 else 0,
+        "samples_ns": samples,
+    }
+
+
+def time_phase(fresh: Callable[[], Any], func: Callable[[Any], Any], repeats: int, warmup: int):
+    """
+    Time a single phase, building fresh inputs for every repeat
+
+    Returns the answer from the final repeat and the timings in nanoseconds.
+    """
+    samples = []
+    answer = None
+    for i in range(warmup + repeats):
+        inputs = fresh()
+        t = -time.perf_counter_ns()
+        answer = func(inputs)
+        t += time.perf_counter_ns()
+        if i >= warmup:
+            samples.append(t)
+    return answer, samples
+
+
+def rss_bytes() -> int:
+    """
+    The resident set size of this process
+
+    Falls back to the peak resident set size where /proc isn't available
+    """
+    try:
+        with open('/proc/self/statm', encoding="utf8") as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (FileNotFoundError, ValueError, OSError):
+        # pylint: disable=import-outside-toplevel
+        import resource
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+def measure_memory(fresh: Callable[[], Any], func: Callable[[Any], Any], top: int = 5) -> dict[str, Any]:
+    """
+    Measure the memory used by a single phase
+
+    The change in RSS is measured on an untraced run, then the phase is run
+    again under tracemalloc for its peak and the allocations it leaves behind.
+    """
+    inputs = fresh()
+    rss = -rss_bytes()
+    func(inputs)
+    rss += rss_bytes()
+    del inputs
+
+    inputs = fresh()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    answer = func(inputs)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    if not tracing:
+        tracemalloc.stop()
+    del answer, inputs
+
+    # Ignore tracemalloc's own bookkeeping
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+    return {
+        "peak_bytes": peak - baseline,
+        "net_bytes": sum(d.size_diff for d in diff),
+        "net_blocks": sum(d.count_diff for d in diff),
+        "rss_delta_bytes": rss,
+        "top_sites": [
+            {"site": f"{os.path.basename(d.traceback[0].filename)}:{d.traceback[0].lineno}",
+             "size_bytes": d.size_diff, "blocks": d.count_diff}
+            for d in diff[:top]
+        ],
+    }
+
+
+def benchmark(
+        day: int, repeats: int = 20, warmup: int = 3,
+        use_cache: bool = True, memory: bool = False,
+) -> dict[str, Any]:
+    """Benchmark every phase of a day and return the results"""
+    solution = get(day)
+    with open(os.path.join(ROOT, solution.input_file), encoding="utf8") as f:
+        text = f.read()
+
+    # Skip parsing for the parts if the parsed inputs are cached
+    blob = cache.fetch(solution) if use_cache else None
+    if not solution.mutates:
+        inputs = solution.parse(io.StringIO(text)) if blob is None else pickle.loads(blob)
+        def fresh():
+            return inputs
+    elif blob is None:
+        def fresh():
+            return solution.parse(io.StringIO(text))
+    else:
+        def fresh():
+            return pickle.loads(blob)
+
+    results: dict[str, Any] = {
+        "day": day,
+        "python": platform.python_version(),
+        "repeats": repeats,
+        "warmup": warmup,
+        "phases": {},
+        "answers": {},
+    }
+    for phase, func in [("parse", solution.parse), *solution.parts()]:
+        if phase == "parse":
+            # The parse phase is always timed from the text
+            answer, samples = time_phase(lambda: io.StringIO(text), func, repeats, warmup)
+        else:
+            answer, samples = time_phase(fresh, func, repeats, warmup)
+        results["phases"][phase] = summarise(samples)
+        if memory:
+            results["phases"][phase]["memory"] = measure_memory(
+                (lambda: io.StringIO(text)) if phase == "parse" else fresh, func
+            )
+        if phase != "parse":
+            results["answers"][phase] = str(answer)
+    return results
+
+
+def write_results(results: dict[str, Any]):
+    """Write benchmark results next to the day's .out file"""
+    name = folder(results["day"])
+    path = os.path.join(ROOT, name, name + '.bench.json')
+    with open(path, 'w', encoding="utf8") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def report(results: dict[str, Any]):
+    """Print a summary of some benchmark results"""
+    print(f":: Advent of Code 2024 -- Day {results['day']} ({results['repeats']} repeats) ::")
+    for phase, stats in results["phases"].items():
+        print(
+            f"{phase:>8}: min {stats['min_ns'] / 1e9: .6f}s"
+            f" | median {stats['median_ns'] / 1e9: .6f}s"
+            f" | p95 {stats['p95_ns'] / 1e9: .6f}s"
+            f" | stddev {stats['stddev_ns'] / 1e9: .6f}s"
+        )
+        if "memory" in stats:
+            mem = stats["memory"]
+            print(
+                f"{'':>8}  peak {mem['peak_bytes'] / 2**20: .3f}MiB"
+                f" | net {mem['net_bytes'] / 2**20: .3f}MiB in {mem['net_blocks']} blocks"
+                f" | rss {mem['rss_delta_bytes'] / 2**20:+.3f}MiB"
+            )
+
+
+def fit(sizes: list[int], samples: list[int]) -> float:
+    """Least squares fit of the exponent k in samples ~ sizes^k"""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1)) for t in samples]
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(ys)
+    var = sum((x - x_mean) ** 2 for x in xs)
+    if not var:
+        return 0.0
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / var
+
+
+def sweep(
+        day: int, sizes: list[int] | None = None, repeats: int = 3,
+        seed: int = 0, **options: Any,
+) -> dict[str, Any]:
+    """
+    Time every phase of a day on synthetic inputs of each size
+
+    The fastest of the repeats is taken for each size since it is the least
+    affected by noise. Options are passed on to the day's generator.
+    """
+    solution = get(day)
+    sizes = sizes or list(GENERATORS[day].sizes)
+    results: dict[str, Any] = {
+        "day": day,
+        "python": platform.python_version(),
+        "repeats": repeats,
+        "seed": seed,
+        "sizes": sizes,
+        "phases": {},
+    }
+    for size in sizes:
+        text = generate(day, size, seed, **options)
+        inputs = solution.parse(io.StringIO(text))
+        if solution.mutates:
+            def fresh():
+                return solution.parse(io.StringIO(text))
+        else:
+            def fresh():
+                return inputs
+
+        for phase, func in [("parse", solution.parse), *solution.parts()]:
+            if phase == "parse":
+                _, samples = time_phase(lambda: io.StringIO(text), func, repeats, 0)
+            else:
+                _, samples = time_phase(fresh, func, repeats, 0)
+            results["phases"].setdefault(phase, {"min_ns": []})["min_ns"].append(min(samples))
+
+    for stats in results["phases"].values():
+        stats["exponent"] = fit(sizes, stats["min_ns"])
+    return results
+
+
+def write_sweep(results: dict[str, Any]):
+    """Write sweep results next to the day's .out file"""
+    name = folder(results["day"])
+    path = os.path.join(ROOT, name, name + '.sweep.json')
+    with open(path, 'w', encoding="utf8") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def report_sweep(results: dict[str, Any]):
+    """Print a summary of some sweep results"""
+    print(f":: Advent of Code 2024 -- Day {results['day']} (sweep) ::")
+    print(f"{'size':>8}: " + " | ".join(f"{n:>10}" for n in results["sizes"]))
+    for phase, stats in results["phases"].items():
+        print(
+            f"{phase:>8}: " + " | ".join(f"{t / 1e9:>9.4f}s" for t in stats["min_ns"])
+            + f" | ~O(n^{stats['exponent']:.2f})"
+        )
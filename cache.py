@@ -0,0 +1,90 @@
+"""
+A content-addressed cache of parsed inputs
+
+Parsed inputs are pickled to .cache/parsed/ under a key made from the
+SHA-256 of the day's input file and of its solution source. Hashing the
+whole solution module (rather than just parse) means a change to any
+class that parse builds also invalidates the cache. The least recently
+used entries are evicted once the cache grows beyond MAX_BYTES.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+from typing import Any, Optional
+
+from solution import ROOT, Solution
+
+CACHE_DIR = os.path.join(ROOT, '.cache', 'parsed')
+MAX_BYTES = 256 * 2**20
+
+
+def sha256_file(path: str) -> str:
+    """Hash the contents of a file"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(2**20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def key(solution: Solution, input_file: Optional[str] = None) -> str:
+    """The cache key for a solution's parsed inputs"""
+    input_hash = sha256_file(os.path.join(ROOT, input_file or solution.input_file))
+    source_hash = hashlib.sha256(inspect.getsource(solution.module).encode("utf8")).hexdigest()
+    return hashlib.sha256(f"{input_hash}:{source_hash}".encode("utf8")).hexdigest()
+
+
+def evict(max_bytes: int = MAX_BYTES):
+    """Remove the least recently used entries until the cache fits in max_bytes"""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    entries = [entry for entry in os.scandir(CACHE_DIR) if entry.is_file()]
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    total = sum(entry.stat().st_size for entry in entries)
+    for entry in entries:
+        if total <= max_bytes:
+            break
+        total -= entry.stat().st_size
+        os.remove(entry.path)
+
+
+def fetch(solution: Solution, input_file: Optional[str] = None, max_bytes: int = MAX_BYTES) -> Optional[bytes]:
+    """
+    Return the pickled parsed inputs for a day
+
+    On a miss the input file is parsed and the result stored. Returns None
+    if the parsed inputs can't be pickled.
+    """
+    path = os.path.join(CACHE_DIR, key(solution, input_file) + '.pickle')
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+        # Touch the entry so that it is the most recently used
+        os.utime(path)
+        return blob
+    except FileNotFoundError:
+        pass
+
+    inputs = solution.load(input_file)
+    try:
+        blob = pickle.dumps(inputs, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write then rename so that concurrent runs never see half an entry
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp, path)
+    evict(max_bytes)
+    return blob
+
+
+def load(solution: Solution, input_file: Optional[str] = None) -> Any:
+    """Load a fresh copy of the parsed inputs for a day, parsing only on a cache miss"""
+    blob = fetch(solution, input_file)
+    if blob is None:
+        return solution.load(input_file)
+    return pickle.loads(blob)
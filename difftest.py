@@ -0,0 +1,419 @@
+"""
+Differential tests of optimised engines against the reference solutions
+
+Each Case pairs a reference implementation with a candidate. Both are run
+on the real input (if there is one) and on thousands of small random inputs
+from generators.py. Any mismatch is shrunk to a minimal counterexample and
+the speedup of the candidate over the reference is reported.
+"""
+import argparse
+from dataclasses import dataclass, field
+import io
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from generators import generate, guard_escapes
+from solution import ROOT, get, load_day
+
+
+@dataclass
+class Engine:
+    """An implementation to compare: how to build its inputs from text and how to run it"""
+    parse: Callable[[str], Any]
+    run: Callable[[Any], Any]
+
+    def __call__(self, text: str) -> Any:
+        return self.run(self.parse(text))
+
+    def timed(self, text: str) -> tuple[Any, int]:
+        """Run on fresh inputs, timing everything but the parse"""
+        inputs = self.parse(text)
+        t = -time.perf_counter_ns()
+        answer = self.run(inputs)
+        t += time.perf_counter_ns()
+        return answer, t
+
+
+def shrink_lines(text: str) -> Iterator[str]:
+    """Smaller inputs made by removing chunks of lines"""
+    lines = text.splitlines(keepends=True)
+    chunk = len(lines) // 2
+    while chunk:
+        for i in range(0, len(lines), chunk):
+            smaller = lines[:i] + lines[i+chunk:]
+            if smaller:
+                yield "".join(smaller)
+        chunk //= 2
+
+
+def shrink_tokens(text: str) -> Iterator[str]:
+    """Smaller inputs made by removing space separated tokens from a single line"""
+    tokens = text.split()
+    chunk = len(tokens) // 2
+    while chunk:
+        for i in range(0, len(tokens), chunk):
+            smaller = tokens[:i] + tokens[i+chunk:]
+            if smaller:
+                yield " ".join(smaller) + "\n"
+        chunk //= 2
+
+
+def shrink_chars(text: str) -> Iterator[str]:
+    """Smaller inputs made by removing chunks of characters from a single line"""
+    line = text.strip()
+    chunk = len(line) // 2
+    while chunk:
+        for i in range(0, len(line), chunk):
+            smaller = line[:i] + line[i+chunk:]
+            if smaller:
+                yield smaller + "\n"
+        chunk //= 2
+
+
+def shrink_grid(text: str, empty: str = ".", keep: str = "^SE@") -> Iterator[str]:
+    """Smaller grids made by removing rows and columns, then by clearing cells"""
+    rows = text.splitlines()
+    yield from (s for s in shrink_lines(text) if len(s.splitlines()) > 1)
+    width = len(rows[0]) if rows else 0
+    for x in range(width):
+        if not any(row[x] in keep for row in rows):
+            yield "".join(row[:x] + row[x+1:] + "\n" for row in rows)
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char not in keep and char != empty:
+                cleared = rows[:y] + [row[:x] + empty + row[x+1:]] + rows[y+1:]
+                yield "".join(r + "\n" for r in cleared)
+
+
+def parsed(day: int) -> Callable[[str], Any]:
+    """Parse text with a day's registered parse"""
+    def parse(text: str):
+        return get(day).parse(io.StringIO(text))
+    return parse
+
+
+@dataclass
+class Case:
+    """
+    A reference and candidate implementation to compare
+
+    sizes are the generator sizes to draw random inputs from, shrink
+    yields smaller versions of an input and valid rejects inputs the
+    reference can't handle (e.g. maps it would loop forever on).
+    """
+    name: str
+    day: int
+    reference: Engine
+    candidate: Engine
+    sizes: tuple[int, ...]
+    shrink: Callable[[str], Iterator[str]] = shrink_lines
+    valid: Callable[[str], bool] = lambda text: True
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Report:
+    """The outcome of differential testing a case"""
+    case: Case
+    trials: int = 0
+    mismatches: int = 0
+    counterexample: Optional[str] = None
+    expected: Any = None
+    actual: Any = None
+    real_match: Optional[bool] = None
+    real_speedup: Optional[float] = None
+    reference_ns: int = 0
+    candidate_ns: int = 0
+
+    @property
+    def random_speedup(self) -> float:
+        """The speedup over all the random inputs"""
+        return self.reference_ns / max(self.candidate_ns, 1)
+
+    @property
+    def passed(self) -> bool:
+        """Whether the candidate agreed with the reference everywhere"""
+        return not self.mismatches and self.real_match is not False
+
+    def found(self, text: str):
+        """Shrink and record the first counterexample found"""
+        if self.counterexample is None:
+            self.counterexample = shrink(self.case, text)
+            self.expected = outcome(self.case.reference, self.counterexample)
+            self.actual = outcome(self.case.candidate, self.counterexample)
+
+
+CASES: dict[str, Case] = {}
+
+
+def register(case: Case) -> Case:
+    """Add a case to be differentially tested"""
+    CASES[case.name] = case
+    return case
+
+
+def outcome(engine: Engine, text: str) -> Any:
+    """Run an engine, treating any exception as part of its answer"""
+    try:
+        return engine(text)
+    except Exception as err:  # pylint: disable=broad-except
+        return err
+
+
+def mismatch(case: Case, text: str) -> bool:
+    """Whether the candidate disagrees with the reference on a valid input"""
+    if not case.valid(text):
+        return False
+    expected = outcome(case.reference, text)
+    # Inputs the reference rejects aren't interesting
+    if isinstance(expected, Exception):
+        return False
+    return outcome(case.candidate, text) != expected
+
+
+def shrink(case: Case, text: str) -> str:
+    """Greedily shrink a counterexample until no smaller input still fails"""
+    improved = True
+    while improved:
+        improved = False
+        for smaller in case.shrink(text):
+            if len(smaller) < len(text) and mismatch(case, smaller):
+                text = smaller
+                improved = True
+                break
+    return text
+
+
+def check(case: Case, trials: int = 1000, seed: int = 0, repeats: int = 3) -> Report:
+    """Differentially test a case on the real input and on random inputs"""
+    report = Report(case)
+
+    # The real input
+    input_file = os.path.join(ROOT, get(case.day).input_file)
+    if os.path.isfile(input_file):
+        with open(input_file, encoding="utf8") as f:
+            text = f.read()
+        ref = [case.reference.timed(text) for _ in range(repeats)]
+        cand = [case.candidate.timed(text) for _ in range(repeats)]
+        report.real_speedup = min(t for _, t in ref) / max(min(t for _, t in cand), 1)
+        report.real_match = ref[0][0] == cand[0][0]
+        if not report.real_match:
+            report.found(text)
+
+    # Random inputs
+    rng = random.Random(seed)
+    for _ in range(trials):
+        text = generate(case.day, rng.choice(case.sizes), rng.getrandbits(32), **case.options)
+        if not case.valid(text):
+            continue
+        report.trials += 1
+        expected, t_ref = case.reference.timed(text)
+        try:
+            actual, t_cand = case.candidate.timed(text)
+        except Exception as err:  # pylint: disable=broad-except
+            actual, t_cand = err, 0
+        report.reference_ns += t_ref
+        report.candidate_ns += t_cand
+        if actual != expected:
+            report.mismatches += 1
+            report.found(text)
+    return report
+
+
+def show(report: Report):
+    """Print a report"""
+    print(f":: Day {report.case.day} -- {report.case.name} ::")
+    if report.real_match is not None:
+        print(f"real input: {'match' if report.real_match else 'MISMATCH'} | speedup {report.real_speedup: .1f}x")
+    print(
+        f"random inputs: {report.trials - report.mismatches}/{report.trials} match"
+        f" | speedup {report.random_speedup: .1f}x"
+    )
+    if report.counterexample is not None:
+        print(f"counterexample (expected {report.expected!r}, got {report.actual!r}):")
+        print(report.counterexample.rstrip())
+
+
+def day06_valid(text: str) -> bool:
+    """
+    Day 6 maps the reference walk leaves rather than looping on
+
+    Cells walled in on three sides are rejected too: a candidate obstacle
+    on the fourth side traps the reference guard turning on the spot.
+    """
+    grid = [list(row) for row in text.splitlines()]
+    starts = [(x, y) for y, row in enumerate(grid) for x, char in enumerate(row) if char == "^"]
+    if len(starts) != 1 or len({len(row) for row in grid}) != 1:
+        return False
+    for y, row in enumerate(grid):
+        for x, char in enumerate(row):
+            walls = sum(
+                0 <= y + dy < len(grid) and 0 <= x + dx < len(row) and grid[y + dy][x + dx] == "#"
+                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            )
+            if char != "#" and walls >= 3:
+                return False
+    return guard_escapes(grid, *starts[0])
+
+
+# Cases
+day06 = load_day(6)
+
+register(Case(
+    "day06-jump", 6,
+    reference=Engine(parsed(6), lambda inputs: day06.part_one(*inputs)),
+    candidate=Engine(parsed(6), lambda inputs: day06.part_one_jump(*inputs)),
+    sizes=(10, 30, 60), shrink=shrink_grid, valid=day06_valid, options={"density": 0.08},
+))
+
+register(Case(
+    "day06-parallel", 6,
+    reference=Engine(parsed(6), lambda inputs: day06.part_one(*inputs)),
+    candidate=Engine(parsed(6), lambda inputs: day06.part_one_parallel(*inputs, workers=2)),
+    sizes=(10, 30, 60), shrink=shrink_grid, valid=day06_valid, options={"density": 0.08},
+))
+
+
+def day09_valid(text: str) -> bool:
+    """
+    Day 9 disk maps the reference part one handles
+
+    The reference backfills from files it has already placed if a gap is
+    bigger than all the file blocks behind it, which real inputs never have.
+    """
+    sizes = list(map(int, text.strip()))
+    files, gaps = sizes[0::2], sizes[1::2]
+    behind = sum(files)
+    for size, gap in zip(files, gaps):
+        behind -= size
+        if gap > behind:
+            return False
+        behind -= gap
+        if not behind:
+            break
+    return True
+
+
+day09 = load_day(9)
+
+register(Case(
+    "day09-disk", 9,
+    reference=Engine(str.strip, day09.part_one),
+    candidate=Engine(parsed(9), day09.part_one_disk),
+    sizes=(10, 100, 1_000), shrink=shrink_chars, valid=day09_valid,
+))
+
+register(Case(
+    "day09-stream", 9,
+    reference=Engine(str.strip, day09.part_one),
+    candidate=Engine(lambda text: io.BytesIO(text.encode()), day09.part_one_stream),
+    sizes=(10, 100, 1_000), shrink=shrink_chars, valid=day09_valid,
+))
+
+register(Case(
+    "day09-heaps", 9,
+    reference=Engine(str.strip, day09.part_two),
+    candidate=Engine(parsed(9), day09.part_two_heaps),
+    sizes=(10, 100, 1_000), shrink=shrink_chars,
+))
+
+day07 = load_day(7)
+
+register(Case(
+    "day07-reverse", 7,
+    reference=Engine(parsed(7), lambda eqs: (day07.part_one(eqs), day07.part_two(eqs))),
+    candidate=Engine(parsed(7), lambda eqs: (day07.part_one_reverse(eqs), day07.part_two_reverse(eqs))),
+    sizes=(10, 100, 200),
+))
+
+register(Case(
+    "day07-memo", 7,
+    reference=Engine(parsed(7), day07.part_two),
+    candidate=Engine(parsed(7), lambda eqs: day07.part_two_memo(eqs, day07.SolveCache(max_size=64))),
+    sizes=(10, 100, 200),
+))
+
+register(Case(
+    "day07-batch", 7,
+    reference=Engine(parsed(7), lambda eqs: (day07.part_one(eqs), day07.part_two(eqs))),
+    candidate=Engine(parsed(7), lambda eqs: day07.part_one_batch(eqs)),
+    sizes=(10, 100, 200),
+))
+
+day14 = load_day(14)
+
+register(Case(
+    "day14-swarm", 14,
+    reference=Engine(lambda text: day14.parse(io.StringIO(text)), lambda r: (day14.part_one(r), day14.part_two(r))),
+    candidate=Engine(parsed(14), lambda swarm: (day14.part_one_swarm(swarm), day14.part_two_swarm(swarm))),
+    sizes=(50, 200, 500),
+))
+
+register(Case(
+    "day14-crt", 14,
+    reference=Engine(lambda text: day14.parse(io.StringIO(text)), day14.part_two),
+    candidate=Engine(parsed(14), day14.part_two_crt),
+    sizes=(800, 1_000, 2_000),
+    # With fewer robots some other time often has unique positions by chance
+    valid=lambda text: text.count("\n") >= 800,
+))
+
+day10 = load_day(10)
+
+register(Case(
+    "day10-levels", 10,
+    reference=Engine(
+        lambda text: day10.parse(io.StringIO(text)), lambda inputs: (day10.part_one(*inputs), day10.part_two(*inputs)),
+    ),
+    candidate=Engine(parsed(10), lambda inputs: day10.part_one_levels(*inputs)),
+    sizes=(10, 50, 100), shrink=shrink_grid,
+))
+
+day11 = load_day(11)
+
+register(Case(
+    "day11-cached", 11,
+    reference=Engine(parsed(11), lambda pebbles: (day11.part_one(pebbles), day11.part_two(pebbles))),
+    candidate=Engine(
+        parsed(11), lambda pebbles: (day11.part_one_cached(pebbles), day11.part_two_cached(pebbles)),
+    ),
+    sizes=(1, 10, 100), shrink=shrink_tokens,
+))
+
+register(Case(
+    "day11-count", 11,
+    reference=Engine(parsed(11), day11.part_two),
+    candidate=Engine(parsed(11), day11.part_two_count),
+    sizes=(1, 10, 100), shrink=shrink_tokens,
+))
+
+register(Case(
+    "day11-matrix", 11,
+    reference=Engine(parsed(11), day11.part_two),
+    candidate=Engine(parsed(11), day11.part_two_matrix),
+    # Single digits keep the closed set of stones small
+    sizes=(1, 5, 10), shrink=shrink_tokens, options={"max_value": 9},
+))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cases", nargs="*", help="case names or days to test (default: all)")
+    parser.add_argument("-n", "--trials", type=int, default=1000, help="random inputs per case")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random inputs")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    selected = [
+        c for c in CASES.values()
+        if not args.cases or c.name in args.cases or str(c.day) in args.cases
+    ]
+    failed = 0
+    for c in selected:
+        r = check(c, args.trials, args.seed)
+        show(r)
+        failed += not r.passed
+    sys.exit(1 if failed else 0)
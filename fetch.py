@@ -0,0 +1,264 @@
+"""
+Fetch puzzle inputs concurrently
+
+Inputs are fetched with asyncio over one pooled requests.Session, retrying
+with exponential backoff on connection errors and server errors. Each input
+is kept in a local store along with its ETag and Last-Modified headers, so
+later fetches are conditional requests that never download the input again.
+
+A small stand-in for the /{year}/day/{day}/input endpoint is included so
+the whole path can be exercised offline, e.g.
+
+    python fetch.py --stand-in 1 2 3
+"""
+import argparse
+import asyncio
+import contextlib
+from email.utils import formatdate
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+from typing import Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from solution import ROOT, folder
+
+YEAR = 2024
+BASE_URL = 'https://adventofcode.com'
+STORE_DIR = os.path.join(ROOT, '.cache', 'inputs')
+
+# Statuses that are worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """An input couldn't be fetched"""
+
+
+class InputStore:
+    """An on-disk store of inputs and the validators needed to revalidate them"""
+    def __init__(self, path: str = STORE_DIR):
+        self.path = path
+
+    def _paths(self, year: int, day: int):
+        base = os.path.join(self.path, str(year), folder(day))
+        return base + '.in', base + '.json'
+
+    def get(self, year: int, day: int) -> tuple[Optional[str], dict[str, str]]:
+        """The stored input and its validators, if there are any"""
+        text_path, meta_path = self._paths(year, day)
+        try:
+            with open(text_path, encoding="utf8") as f:
+                text = f.read()
+            with open(meta_path, encoding="utf8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None, {}
+        return text, meta
+
+    def put(self, year: int, day: int, text: str, meta: dict[str, str]):
+        """Store an input and its validators"""
+        text_path, meta_path = self._paths(year, day)
+        os.makedirs(os.path.dirname(text_path), exist_ok=True)
+        with open(text_path, 'w', encoding="utf8") as f:
+            f.write(text)
+        with open(meta_path, 'w', encoding="utf8") as f:
+            json.dump(meta, f)
+
+
+class Fetcher:
+    """Fetch inputs concurrently with retries and revalidation"""
+    def __init__(
+            self, cookies: Optional[dict[str, str]] = None,
+            base_url: str = BASE_URL, year: int = YEAR,
+            store: Optional[InputStore] = None,
+            concurrency: int = 4, retries: int = 3, backoff: float = 0.5, timeout: float = 5,
+    ):
+        if cookies is None:
+            # pylint: disable=import-outside-toplevel
+            import credentials
+            cookies = credentials.credentials
+        self.base_url = base_url.rstrip('/')
+        self.year = year
+        self.store = store or InputStore()
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+        # Share one pool of connections between every request
+        self.session = requests.Session()
+        self.session.cookies.update(cookies)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        """Close the pooled connections"""
+        self.session.close()
+
+    def _get(self, url: str, headers: dict[str, str]) -> requests.Response:
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    async def fetch(self, day: int) -> str:
+        """Fetch the input for a day, revalidating any stored copy"""
+        url = f"{self.base_url}/{self.year}/day/{day}/input"
+        stored, meta = self.store.get(self.year, day)
+        headers = {}
+        if stored is not None:
+            if "etag" in meta:
+                headers["If-None-Match"] = meta["etag"]
+            if "last_modified" in meta:
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.semaphore:
+                    response = await asyncio.to_thread(self._get, url, headers)
+            except requests.RequestException as err:
+                if attempt == self.retries:
+                    raise FetchError(f"Day {day}: {err}") from err
+            else:
+                if response.status_code == 304 and stored is not None:
+                    return stored
+                if response.status_code == 200:
+                    meta = {}
+                    if "ETag" in response.headers:
+                        meta["etag"] = response.headers["ETag"]
+                    if "Last-Modified" in response.headers:
+                        meta["last_modified"] = response.headers["Last-Modified"]
+                    self.store.put(self.year, day, response.text, meta)
+                    return response.text
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    raise FetchError(f"Day {day}: got status={response.status_code}, reason={response.reason}")
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+        raise FetchError(f"Day {day}: out of retries")
+
+    async def fetch_all(self, days: list[int]) -> dict[int, str | FetchError]:
+        """Fetch many days concurrently, returning the input or error for each"""
+        results = await asyncio.gather(*(self.fetch(day) for day in days), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, FetchError):
+                raise result
+        return dict(zip(days, results))  # type: ignore[arg-type]
+
+
+def fetch_inputs(days: list[int], write: bool = True, **kwargs) -> dict[int, str | FetchError]:
+    """Fetch the inputs for some days, writing them to DayNN/DayNN.in where the folder exists"""
+    async def run():
+        fetcher = Fetcher(**kwargs)
+        try:
+            return await fetcher.fetch_all(days)
+        finally:
+            fetcher.close()
+
+    results = asyncio.run(run())
+    if write:
+        for day, text in results.items():
+            name = folder(day)
+            if isinstance(text, str) and os.path.isdir(os.path.join(ROOT, name)):
+                with open(os.path.join(ROOT, name, name + '.in'), 'w', encoding="utf8") as f:
+                    f.write(text)
+    return results
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve puzzle inputs like adventofcode.com does"""
+    server: "StandInServer"
+
+    re_path = re.compile(r"/(\d{4})/day/(\d{1,2})/input")
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve an input, honouring conditional request headers"""
+        m = self.re_path.fullmatch(self.path)
+        if m is None or int(m[2]) not in self.server.inputs:
+            self.send_error(404)
+            return
+        day = int(m[2])
+        self.server.requests[day] = self.server.requests.get(day, 0) + 1
+        if self.server.requests[day] <= self.server.failures:
+            self.send_error(503)
+            return
+
+        body = self.server.inputs[day].encode("utf8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag or (
+                "If-None-Match" not in self.headers
+                and self.headers.get("If-Modified-Since") == self.server.last_modified):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.server.last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep quiet"""
+
+
+class StandInServer(ThreadingHTTPServer):
+    """A local stand-in for the puzzle input endpoint"""
+    def __init__(self, inputs: dict[int, str], failures: int = 0):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.inputs = inputs
+        # Fail the first few requests for each day to exercise retries
+        self.failures = failures
+        self.requests: dict[int, int] = {}
+        self.last_modified = formatdate(usegmt=True)
+
+    @property
+    def url(self) -> str:
+        """The base url to fetch from"""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@contextlib.contextmanager
+def stand_in(inputs: dict[int, str], failures: int = 0) -> Iterator[StandInServer]:
+    """Run a stand-in server in a background thread"""
+    server = StandInServer(inputs, failures)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("days", nargs="+", type=int, help="days to fetch")
+    parser.add_argument("-j", "--concurrency", type=int, default=4, help="concurrent requests")
+    parser.add_argument("--stand-in", action="store_true", help="fetch from a local stand-in server")
+    args = parser.parse_args()
+
+    if args.stand_in:
+        # Fetch twice from a flaky stand-in with a throwaway store: once to download, once to revalidate
+        with tempfile.TemporaryDirectory() as tmp, stand_in({d: f"input for day {d}\n" for d in args.days}, 1) as srv:
+            for _ in range(2):
+                fetched = fetch_inputs(
+                    args.days, write=False, cookies={}, base_url=srv.url,
+                    store=InputStore(tmp), concurrency=args.concurrency, backoff=0.01,
+                )
+                print({d: r if isinstance(r, FetchError) else f"{len(r)} chars" for d, r in fetched.items()})
+            print(f"Requests served: {srv.requests}")
+        sys.exit(0)
+
+    fetched = fetch_inputs(args.days, concurrency=args.concurrency)
+    failed = [r for r in fetched.values() if isinstance(r, FetchError)]
+    for err in failed:
+        print(err)
+    sys.exit(1 if failed else 0)
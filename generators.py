@@ -0,0 +1,317 @@
+"""
+Seeded generators of synthetic puzzle inputs
+
+The real puzzle inputs are small, so these generators build inputs of any
+size to show how each solution scales. Every generator takes a size and a
+random.Random and returns the plaintext input. What size means is up to
+each day and is described in its docstring.
+"""
+from dataclasses import dataclass
+import math
+import random
+from typing import Any, Callable
+
+
+@dataclass
+class Generator:
+    """A synthetic input generator and the sizes to sweep it over by default"""
+    day: int
+    generate: Callable[..., str]
+    sizes: tuple[int, ...]
+
+
+GENERATORS: dict[int, Generator] = {}
+
+
+def generator(day: int, sizes: tuple[int, ...]):
+    """Register a generator for a day"""
+    def decorator(func: Callable[..., str]):
+        GENERATORS[day] = Generator(day, func, sizes)
+        return func
+    return decorator
+
+
+def generate(day: int, size: int, seed: int = 0, **options: Any) -> str:
+    """Generate an input for a day"""
+    return GENERATORS[day].generate(size, random.Random(seed), **options)
+
+
+@generator(1, sizes=(1_000, 2_000, 4_000, 8_000))
+def day01(size: int, rng: random.Random) -> str:
+    """size pairs of location ids"""
+    return "".join(f"{rng.randint(10_000, 99_999)}   {rng.randint(10_000, 99_999)}\n" for _ in range(size))
+
+
+@generator(2, sizes=(1_000, 10_000, 100_000))
+def day02(size: int, rng: random.Random) -> str:
+    """size reports, most of them nearly safe"""
+    lines = []
+    for _ in range(size):
+        level = rng.randint(1, 50)
+        sign = rng.choice((-1, 1))
+        levels = []
+        for _ in range(rng.randint(5, 8)):
+            levels.append(level)
+            # Mostly safe steps with the occasional bad one
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.choice((0, 4, 5))
+            level = max(1, level + sign * step)
+        lines.append(" ".join(map(str, levels)) + "\n")
+    return "".join(lines)
+
+
+@generator(3, sizes=(10_000, 100_000, 1_000_000))
+def day03(size: int, rng: random.Random) -> str:
+    """size characters of corrupted memory"""
+    noise = "abcdefghijklmnopqrstuvwxyz!@#$%^&*()[]{}<>,;:+-_ "
+    chunks = []
+    length = 0
+    while length < size:
+        r = rng.random()
+        if r < 0.1:
+            chunk = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif r < 0.12:
+            chunk = "do()"
+        elif r < 0.14:
+            chunk = "don't()"
+        else:
+            chunk = "".join(rng.choices(noise, k=rng.randint(1, 8)))
+        chunks.append(chunk)
+        length += len(chunk)
+    return "".join(chunks) + "\n"
+
+
+@generator(4, sizes=(100, 200, 400, 800))
+def day04(size: int, rng: random.Random) -> str:
+    """a size x size word search"""
+    return "".join("".join(rng.choices("XMAS", k=size)) + "\n" for _ in range(size))
+
+
+@generator(5, sizes=(100, 1_000, 10_000))
+def day05(size: int, rng: random.Random) -> str:
+    """
+    size pages with size updates
+
+    Rules are only given between pages that appear in the same update, which
+    is enough for every update to be totally ordered.
+    """
+    order = list(range(10, 10 + size))
+    rng.shuffle(order)
+    rules: set[tuple[int, int]] = set()
+    updates = []
+    for _ in range(size):
+        k = min(size, rng.choice(range(5, 24, 2)))
+        start = rng.randint(0, size - k)
+        pages = sorted(rng.sample(range(start, min(size, start + 3 * k)), k))
+        update = [order[i] for i in pages]
+        rules.update((x, y) for i, x in enumerate(update) for y in update[i+1:])
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(update)
+    return (
+        "".join(f"{x}|{y}\n" for x, y in rules)
+        + "\n"
+        + "".join(",".join(map(str, update)) + "\n" for update in updates)
+    )
+
+
+def guard_escapes(grid: list[list[str]], x: int, y: int) -> bool:
+    """Check that a guard walking on a generated Day 6 map leaves it rather than looping forever"""
+    height, width = len(grid), len(grid[0])
+    dx, dy = 0, -1
+    seen = set()
+    while True:
+        if (x, y, dx, dy) in seen:
+            return False
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < width and 0 <= ny < height):
+            return True
+        if grid[ny][nx] == "#":
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+
+
+@generator(6, sizes=(50, 100, 200))
+def day06(size: int, rng: random.Random, density: float = 0.03) -> str:
+    """a size x size map with a guard that eventually leaves it"""
+    while True:
+        grid = [["#" if rng.random() < density else "." for _ in range(size)] for _ in range(size)]
+        x, y = rng.randrange(size), rng.randrange(size)
+        grid[y][x] = "^"
+        if guard_escapes(grid, x, y):
+            return "".join("".join(row) + "\n" for row in grid)
+
+
+@generator(7, sizes=(100, 200, 400, 800))
+def day07(size: int, rng: random.Random, max_numbers: int = 12) -> str:
+    """size equations of up to max_numbers numbers, about half of them valid"""
+    lines = []
+    for _ in range(size):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, max_numbers))]
+        value = numbers[0]
+        for n in numbers[1:]:
+            match rng.choice("+*|"):
+                case "+":
+                    value += n
+                case "*":
+                    value *= n
+                case "|":
+                    value = int(f"{value}{n}")
+        if rng.random() < 0.5:
+            value += 1
+        lines.append(f"{value}: {' '.join(map(str, numbers))}\n")
+    return "".join(lines)
+
+
+@generator(8, sizes=(50, 100, 200, 400))
+def day08(size: int, rng: random.Random, density: float = 0.02) -> str:
+    """a size x size map of antennae"""
+    frequencies = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return "".join(
+        "".join(rng.choice(frequencies) if rng.random() < density else "." for _ in range(size)) + "\n"
+        for _ in range(size)
+    )
+
+
+@generator(9, sizes=(1_000, 2_000, 4_000, 8_000))
+def day09(size: int, rng: random.Random) -> str:
+    """a disk map of size digits"""
+    digits = [
+        str(rng.randint(1, 9)) if not i % 2 else str(rng.randint(0, 9))
+        for i in range(size if size % 2 else size + 1)
+    ]
+    return "".join(digits) + "\n"
+
+
+@generator(10, sizes=(50, 100, 200, 400))
+def day10(size: int, rng: random.Random, noise: float = 0.1) -> str:
+    """a size x size topography of diagonal ridges with some noise"""
+    return "".join(
+        "".join(
+            str(rng.randint(0, 9)) if rng.random() < noise else str((x + y) % 10)
+            for x in range(size)
+        ) + "\n"
+        for y in range(size)
+    )
+
+
+@generator(11, sizes=(10, 100, 1_000))
+def day11(size: int, rng: random.Random, max_value: int = 10**6) -> str:
+    """size stones engraved with up to max_value"""
+    return " ".join(str(rng.randint(0, max_value)) for _ in range(size)) + "\n"
+
+
+@generator(12, sizes=(50, 100, 200))
+def day12(size: int, rng: random.Random, crops: str = "ABCDEFGH") -> str:
+    """a size x size garden of blocky regions"""
+    block = 4
+    blocks = [[rng.choice(crops) for _ in range(size // block + 1)] for _ in range(size // block + 1)]
+    return "".join(
+        "".join(
+            rng.choice(crops) if rng.random() < 0.05 else blocks[y // block][x // block]
+            for x in range(size)
+        ) + "\n"
+        for y in range(size)
+    )
+
+
+@generator(13, sizes=(1_000, 10_000, 100_000))
+def day13(size: int, rng: random.Random) -> str:
+    """size claw machines, about half of them winnable"""
+    machines = []
+    for _ in range(size):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        # Colinear buttons aren't in the real inputs
+        while ax * by == ay * bx:
+            bx, by = rng.randint(10, 99), rng.randint(10, 99)
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        px, py = a * ax + b * bx, a * ay + b * by
+        if rng.random() < 0.5:
+            px += 1
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n")
+    return "\n".join(machines)
+
+
+@generator(14, sizes=(500, 1_000, 2_000, 4_000))
+def day14(size: int, rng: random.Random, dims: complex | None = None) -> str:
+    """
+    size robots in a lobby of dims (Day14.LOBBY_DIMS by default)
+
+    The robots are placed so that at some time within the period of the
+    lobby they all occupy unique positions, clustered in a rectangle like
+    the picture in the real inputs, so size must fit in the lobby.
+    """
+    if dims is None:
+        # pylint: disable=import-outside-toplevel
+        from solution import load_day
+        dims = load_day(14).LOBBY_DIMS
+    width, height = int(dims.real), int(dims.imag)
+    if size > width * height:
+        raise ValueError(f"{size} robots won't fit in a {width}x{height} lobby")
+    # A rectangle about half full of robots
+    rw = min(width, math.isqrt(2 * size) + 1)
+    rh = min(height, -(-2 * size // rw))
+    if rw * rh < size:
+        rw, rh = width, height
+    x0, y0 = rng.randint(0, width - rw), rng.randint(0, height - rh)
+    t = rng.randrange(width * height)
+    lines = []
+    for cell in rng.sample(range(rw * rh), size):
+        vx, vy = rng.randint(-width + 1, width - 1), rng.randint(-height + 1, height - 1)
+        # Rewind from the picture at time t
+        x, y = (x0 + cell % rw - vx * t) % width, (y0 + cell // rw - vy * t) % height
+        lines.append(f"p={x},{y} v={vx},{vy}\n")
+    return "".join(lines)
+
+
+@generator(15, sizes=(20, 40, 80))
+def day15(size: int, rng: random.Random) -> str:
+    """a size x size warehouse with size * 20 moves"""
+    grid = [
+        ["#" if x in (0, size - 1) or y in (0, size - 1) else rng.choices(".O#", (0.7, 0.25, 0.05))[0]
+         for x in range(size)]
+        for y in range(size)
+    ]
+    grid[size // 2][size // 2] = "@"
+    moves = "".join(rng.choices("^v<>", k=size * 20))
+    # Moves are wrapped over lines in the real inputs
+    wrapped = "\n".join(moves[i:i+1000] for i in range(0, len(moves), 1000))
+    return "".join("".join(row) + "\n" for row in grid) + "\n" + wrapped + "\n"
+
+
+@generator(16, sizes=(51, 101, 201))
+def day16(size: int, rng: random.Random, loops: float = 0.05) -> str:
+    """
+    a size x size maze
+
+    A perfect maze is carved with a randomised depth-first search and some
+    extra walls are knocked through so that there are multiple best paths.
+    """
+    size += not size % 2
+    grid = [["#"] * size for _ in range(size)]
+    start = (1, size - 2)
+    grid[start[1]][start[0]] = "."
+    stack = [start]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (x + dx, y + dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < x + dx < size - 1 and 0 < y + dy < size - 1 and grid[y + dy][x + dx] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny = rng.choice(options)
+        grid[(y + ny) // 2][(x + nx) // 2] = "."
+        grid[ny][nx] = "."
+        stack.append((nx, ny))
+
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            if grid[y][x] == "#" and (x + y) % 2 and rng.random() < loops:
+                grid[y][x] = "."
+
+    grid[size - 2][1] = "S"
+    grid[1][size - 2] = "E"
+    return "".join("".join(row) + "\n" for row in grid)
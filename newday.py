@@ -3,17 +3,50 @@ Create a new folder for the current day
 """
 import os
 import sys
-import shutil
 import re
 from scrape import scrape, EarlyError, RequestError
 
+# The scaffold for a new day, registered with the shared Solution entry point
+SCAFFOLD = '''"""AoC :: Day {day}"""
+from dataclasses import dataclass
+import math
+import os
+import re
+import sys
+from typing import Literal, Optional, TextIO
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solution import Solution, register  # pylint: disable=wrong-import-position
+DAY = {day}
+
+
+def parse(file: TextIO):
+    """Parse the plaintext input"""
+    return [i[:-1] for i in file.readlines()]
+
+
+def part_one(inputs: list[str]):
+    """Solution to part one"""
+    return 1
+
+
+def part_two(inputs: list[str]):
+    """Solution to part two"""
+    return 2
+
+
+solution = register(Solution(DAY, parse, part_one, part_two))
+
+
+if __name__ == "__main__":
+    solution.main()
+'''
+
 
 def main(day=None):
     """
     Create new folder for AoC puzzle and try to scrape for puzzle inputs
     """
     # Static vars
-    template = 'Template/'
     pattern = r'Day(\d{2})'
 
     if day is None:
@@ -37,20 +70,10 @@ def main(day=None):
 
     s = 'Day' + str(n).zfill(2)
 
-    # Copy Template folder
-    shutil.copytree(template, s)
-
-    folder = s + '/'
-
-    with open(folder +'DayXX.py', 'r+', encoding="utf8") as f:
-        t = f.read()
-        f.seek(0)
-        t = t.replace('DayXX', s).replace('XX', f'{n}')
-        f.write(t)
-        f.truncate()
-
-    for file in os.listdir(folder):
-        os.rename(folder+file, folder+file.replace('DayXX', s))
+    # Scaffold the new day
+    os.mkdir(s)
+    with open(f"{s}/{s}.py", 'w', encoding="utf8") as f:
+        f.write(SCAFFOLD.format(day=n))
 
     print(f'Writing inputs to {s}/{s}.in')
     with open(f"{s}/{s}.in", 'w', encoding="utf8") as f:
@@ -0,0 +1,167 @@
+"""
+A local history of benchmark results
+
+Every benchmark run is recorded in perf.sqlite along with the git commit and
+Python version it was run with. The compare command benchmarks the working
+tree and fails if any phase of any day is slower than a stored baseline.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from typing import Any
+
+from solution import ROOT, discover
+
+DATABASE = os.path.join(ROOT, 'perf.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    day INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    python TEXT NOT NULL,
+    repeats INTEGER NOT NULL,
+    min_ns INTEGER NOT NULL,
+    median_ns INTEGER NOT NULL,
+    p95_ns INTEGER NOT NULL,
+    stddev_ns INTEGER NOT NULL,
+    samples_ns TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_lookup ON runs (git_commit, day, phase);
+"""
+
+
+def connect(path: str = DATABASE) -> sqlite3.Connection:
+    """Open the database, creating it if needed"""
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    db.executescript(SCHEMA)
+    return db
+
+
+def git(*args: str) -> str:
+    """Run a git command in the repo and return its output"""
+    return subprocess.run(
+        ("git", *args), cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def current_commit() -> tuple[str, bool]:
+    """The commit of the working tree and whether it has uncommitted changes"""
+    try:
+        return git("rev-parse", "HEAD"), bool(git("status", "--porcelain", "--untracked-files=no"))
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", True
+
+
+def record(results: dict[str, Any], db: sqlite3.Connection | None = None):
+    """Store the results of benchmark.benchmark()"""
+    db = db or connect()
+    commit, dirty = current_commit()
+    with db:
+        db.executemany(
+            """
+            INSERT INTO runs (
+                created, day, phase, git_commit, dirty, python, repeats,
+                min_ns, median_ns, p95_ns, stddev_ns, samples_ns
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    time.time(), results["day"], phase, commit, dirty, results["python"], results["repeats"],
+                    stats["min_ns"], stats["median_ns"], stats["p95_ns"], stats["stddev_ns"],
+                    json.dumps(stats["samples_ns"]),
+                )
+                for phase, stats in results["phases"].items()
+            ],
+        )
+
+
+def baseline(commit: str, db: sqlite3.Connection | None = None) -> dict[tuple[int, str], sqlite3.Row]:
+    """The most recent clean result for each (day, phase) recorded at a commit"""
+    db = db or connect()
+    rows = db.execute(
+        "SELECT * FROM runs WHERE git_commit = ? AND NOT dirty ORDER BY created", (commit,)
+    ).fetchall()
+    # Later rows overwrite earlier ones
+    return {(row["day"], row["phase"]): row for row in rows}
+
+
+def compare(days: list[int], ref: str = "HEAD", threshold: float = 0.1, repeats: int = 20, warmup: int = 3):
+    """
+    Benchmark the working tree against the baseline stored for ref
+
+    A phase regresses if its median is more than threshold (as a fraction) slower.
+    Returns the number of regressions.
+    """
+    # pylint: disable=import-outside-toplevel
+    from benchmark import benchmark
+
+    db = connect()
+    commit = git("rev-parse", ref)
+    base = baseline(commit, db)
+    if not base:
+        print(f"No clean results recorded for {ref} ({commit[:8]})")
+        return 0
+
+    os.chdir(ROOT)
+    regressions = 0
+    print(f":: Comparing working tree against {ref} ({commit[:8]}), threshold {threshold:.0%} ::")
+    for day in days or sorted({d for d, _ in base}):
+        results = benchmark(day, repeats, warmup)
+        record(results, db)
+        for phase, stats in results["phases"].items():
+            if (day, phase) not in base:
+                continue
+            old, new = base[(day, phase)]["median_ns"], stats["median_ns"]
+            change = (new - old) / old if old else 0.0
+            slower = change > threshold
+            regressions += slower
+            print(
+                f"Day {day:>2} {phase:>8}: {old / 1e9: .6f}s -> {new / 1e9: .6f}s ({change:+.1%})"
+                + ("  << REGRESSION" if slower else "")
+            )
+    return regressions
+
+
+def history(day: int, db: sqlite3.Connection | None = None):
+    """Print the recorded medians of a day over time"""
+    db = db or connect()
+    rows = db.execute("SELECT * FROM runs WHERE day = ? ORDER BY created", (day,)).fetchall()
+    for row in rows:
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(row["created"]))
+        dirty = "+" if row["dirty"] else " "
+        print(
+            f"{created} {row['git_commit'][:8]}{dirty} py{row['python']:<8}"
+            f" {row['phase']:>8}: median {row['median_ns'] / 1e9: .6f}s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser = commands.add_parser("compare", help="benchmark the working tree against a baseline")
+    compare_parser.add_argument("days", nargs="*", type=int, help="days to compare (default: all in baseline)")
+    compare_parser.add_argument("--ref", default="HEAD", help="git ref of the baseline (default: HEAD)")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=0.1, help="allowed slowdown (default: 0.1)")
+    compare_parser.add_argument("-n", "--repeats", type=int, default=20, help="timed repeats per phase")
+    compare_parser.add_argument("-w", "--warmup", type=int, default=3, help="warmup runs per phase")
+
+    history_parser = commands.add_parser("history", help="show the recorded history of days")
+    history_parser.add_argument("days", nargs="*", type=int, help="days to show (default: all)")
+
+    args = parser.parse_args()
+    match args.command:
+        case "compare":
+            sys.exit(1 if compare(args.days, args.ref, args.threshold, args.repeats, args.warmup) else 0)
+        case "history":
+            for d in args.days or discover():
+                history(d)
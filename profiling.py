@@ -0,0 +1,101 @@
+"""
+Profile each phase of a day with cProfile
+
+Every phase is profiled separately and dumped to DayNN/DayNN.<phase>.pstats.
+A collapsed-stack file (DayNN/DayNN.<phase>.folded) is also written so that
+standard flamegraph tools (flamegraph.pl, speedscope, inferno) can render it.
+"""
+import cProfile
+import io
+import os
+import pstats
+from typing import Any, Callable
+
+import cache
+from solution import ROOT, folder, get
+
+# Deeper stacks than this are truncated when folding
+MAX_DEPTH = 200
+
+
+def label(func: tuple[str, int, str]) -> str:
+    """A flamegraph frame label for a pstats function key"""
+    filename, lineno, name = func
+    if filename == '~':
+        # Built-ins
+        return name.replace(';', ',')
+    return f"{os.path.basename(filename)}:{lineno}:{name}".replace(';', ',')
+
+
+def fold(stats: pstats.Stats) -> dict[str, int]:
+    """
+    Collapse a profile into stacks and their self time in microseconds
+
+    cProfile only records caller -> callee edges, so the time spent in a
+    function is split between the stacks it is reached from in proportion
+    to the time each caller spent in it.
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: dict[tuple, dict[tuple, float]] = {func: {} for func in raw}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, edge_ct) in callers.items():
+            callees.setdefault(caller, {})[func] = edge_ct
+    roots = [func for func, (_, _, _, _, callers) in raw.items() if not callers]
+
+    folded: dict[str, int] = {}
+
+    def walk(func: tuple, stack: list[tuple], scale: float):
+        """Attribute scale of func's time to this stack and recurse into its callees"""
+        _, _, tt, ct, _ = raw[func]
+        frames = ';'.join(label(f) for f in stack)
+        folded[frames] = folded.get(frames, 0) + int(tt * scale * 1e6)
+        if len(stack) >= MAX_DEPTH or not ct:
+            return
+        for callee, edge_ct in callees.get(func, {}).items():
+            # Don't follow recursion, its time is already counted in the caller's cumulative time
+            if callee in stack or callee not in raw or not raw[callee][3]:
+                continue
+            walk(callee, stack + [callee], scale * edge_ct / raw[callee][3])
+
+    for root in roots:
+        walk(root, [root], 1.0)
+    return {frames: us for frames, us in folded.items() if us > 0}
+
+
+def profile_phase(func: Callable[[Any], Any], inputs: Any) -> pstats.Stats:
+    """Profile a single call"""
+    profiler = cProfile.Profile()
+    profiler.runcall(func, inputs)
+    return pstats.Stats(profiler)
+
+
+def profile(day: int, top: int = 10) -> list[str]:
+    """Profile every phase of a day, returning the paths of the files written"""
+    solution = get(day)
+    with open(os.path.join(ROOT, solution.input_file), encoding="utf8") as f:
+        text = f.read()
+
+    name = folder(day)
+    paths = []
+    print(f":: Advent of Code 2024 -- Day {day} (profile) ::")
+    for phase, func in [("parse", solution.parse), *solution.parts()]:
+        if phase == "parse":
+            inputs: Any = io.StringIO(text)
+        else:
+            inputs = cache.load(solution)
+        stats = profile_phase(func, inputs)
+
+        base = os.path.join(ROOT, name, f"{name}.{phase}")
+        stats.dump_stats(base + '.pstats')
+        with open(base + '.folded', 'w', encoding="utf8") as f:
+            for frames, us in fold(stats).items():
+                f.write(f"{frames} {us}\n")
+        paths += [base + '.pstats', base + '.folded']
+
+        print(f":: {phase} ::")
+        stats.stream = io.StringIO()  # type: ignore[attr-defined]
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+        # Skip the pstats preamble and only show the table
+        table = stats.stream.getvalue()  # type: ignore[attr-defined]
+        print(table[table.find("   ncalls"):].rstrip())
+    return paths
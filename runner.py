@@ -0,0 +1,150 @@
+"""
+Run every day's solution in one go
+
+Each day is run in a worker of a process pool and its output is written to
+DayNN/DayNN.out, just like the runday shell function. Days are scheduled
+slowest-first (according to the timings in the existing .out files) so that
+the total wall-clock time ends up close to that of the slowest day.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
+import io
+import math
+import os
+import re
+import sys
+import time
+
+from solution import ROOT, discover, folder, get
+
+# Pattern for reading the previous runtime of a day
+re_runtime = re.compile(r":: total runtime:\s*([\d.]+)s ::")
+
+
+def last_runtime(day: int) -> float:
+    """
+    Read the total runtime recorded in a day's .out file
+
+    Days that have never been run are assumed to be slow so they get scheduled first
+    """
+    name = folder(day)
+    try:
+        with open(os.path.join(ROOT, name, name + '.out'), encoding="utf8") as f:
+            m = re_runtime.search(f.read())
+    except FileNotFoundError:
+        return math.inf
+    return float(m[1]) if m else math.inf
+
+
+def run_day(day: int):
+    """Run a day's solution and write whatever it prints to DayNN.out"""
+    solution = get(day)
+    buffer = io.StringIO()
+    t = -time.perf_counter()
+    with contextlib.redirect_stdout(buffer):
+        solution.main()
+    t += time.perf_counter()
+
+    name = folder(day)
+    with open(os.path.join(ROOT, name, name + '.out'), 'w', encoding="utf8") as f:
+        f.write(buffer.getvalue())
+    return t
+
+
+def main(days: list[int] | None = None, workers: int | None = None):
+    """Run the given days (or all of them) across a process pool"""
+    # Input files are relative to the repo root
+    os.chdir(ROOT)
+    days = days or discover()
+    schedule = sorted(days, key=last_runtime, reverse=True)
+    print(f":: Advent of Code 2024 -- running {len(schedule)} days ::")
+
+    t = -time.perf_counter()
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_day, day): day for day in schedule}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                runtime = future.result()
+            except Exception as err:  # pylint: disable=broad-except
+                failures += 1
+                print(f"Day {day} failed: {err!r}")
+                continue
+            print(f"Day {day} finished, runtime: {runtime: .4f}s")
+    t += time.perf_counter()
+
+    print(f":: wall-clock runtime: {t: .4f}s ::")
+    return 1 if failures else 0
+
+
+def benchmark_days(
+        days: list[int] | None = None, repeats: int = 20, warmup: int = 3,
+        use_cache: bool = True, memory: bool = False,
+):
+    """
+    Benchmark the given days (or all of them)
+
+    Days are benchmarked one at a time so they don't compete for the CPU
+    """
+    # pylint: disable=import-outside-toplevel
+    from benchmark import benchmark, report, write_results
+    from perfdb import record
+
+    os.chdir(ROOT)
+    for day in days or discover():
+        results = benchmark(day, repeats, warmup, use_cache, memory)
+        record(results)
+        report(results)
+        print(f"Results written to {os.path.relpath(write_results(results), ROOT)}")
+    return 0
+
+
+def sweep_days(days: list[int] | None = None, sizes: list[int] | None = None, repeats: int = 3):
+    """Time the given days (or all of them) on synthetic inputs of increasing size"""
+    # pylint: disable=import-outside-toplevel
+    from benchmark import report_sweep, sweep, write_sweep
+
+    os.chdir(ROOT)
+    for day in days or discover():
+        results = sweep(day, sizes, repeats)
+        report_sweep(results)
+        print(f"Results written to {os.path.relpath(write_sweep(results), ROOT)}")
+    return 0
+
+
+def profile_days(days: list[int] | None = None, top: int = 10):
+    """Profile each phase of the given days (or all of them)"""
+    # pylint: disable=import-outside-toplevel
+    from profiling import profile
+
+    os.chdir(ROOT)
+    for day in days or discover():
+        paths = profile(day, top)
+        print(f"Profiles written to {', '.join(os.path.relpath(p, ROOT) for p in paths)}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("-b", "--benchmark", action="store_true", help="benchmark each phase instead of running once")
+    parser.add_argument("-n", "--repeats", type=int, default=None, help="timed repeats per phase (default: 20, 3 when sweeping)")
+    parser.add_argument("-w", "--warmup", type=int, default=3, help="warmup runs per phase when benchmarking")
+    parser.add_argument("-s", "--sweep", action="store_true", help="time each phase on synthetic inputs of increasing size")
+    parser.add_argument("--sizes", nargs="+", type=int, default=None, help="input sizes to sweep over")
+    parser.add_argument("-m", "--memory", action="store_true", help="also measure memory use when benchmarking")
+    parser.add_argument("-p", "--profile", action="store_true", help="profile each phase with cProfile")
+    parser.add_argument("--top", type=int, default=10, help="functions to show per phase when profiling")
+    parser.add_argument("--no-cache", action="store_true", help="re-parse inputs instead of using the parse cache")
+    args = parser.parse_args()
+
+    if args.sweep:
+        sys.exit(sweep_days(args.days, args.sizes, args.repeats or 3))
+    if args.profile:
+        sys.exit(profile_days(args.days, args.top))
+    if args.benchmark or args.memory:
+        sys.exit(benchmark_days(args.days, args.repeats or 20, args.warmup, not args.no_cache, args.memory))
+    sys.exit(main(args.days, args.workers))
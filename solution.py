@@ -0,0 +1,139 @@
+"""
+The shared entry point for every day's solution
+
+Each DayNN/DayNN.py registers a Solution describing how to parse its input
+and run its parts. The runner, benchmark, profiler and cache all work from
+the registry instead of from each day's copy of main().
+"""
+from dataclasses import dataclass
+import importlib
+import inspect
+import os
+import re
+import sys
+import time
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PHASES = ("parse", "part_one", "part_two")
+
+# Pattern for finding day folders
+re_day = re.compile(r"Day(\d{2})")
+
+
+def folder(day: int) -> str:
+    """The folder (and module) name for a given day"""
+    return 'Day' + str(day).zfill(2)
+
+
+def discover() -> list[int]:
+    """Find every day that has a DayNN/DayNN.py solution"""
+    days = []
+    for name in os.listdir(ROOT):
+        m = re_day.fullmatch(name)
+        if m and os.path.isfile(os.path.join(ROOT, name, name + '.py')):
+            days.append(int(m[1]))
+    return sorted(days)
+
+
+def load_day(day: int):
+    """Import the solution module for a day"""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    name = folder(day)
+    return importlib.import_module(f"{name}.{name}")
+
+
+@dataclass
+class Solution:
+    """
+    A day's solution
+
+    parse takes the input file and the parts take whatever parse returns,
+    splatted into positional arguments if unpack is set. If fused then
+    part_one returns the answers to both parts and there is no part_two.
+    Days whose parts modify their inputs in place set mutates so that fresh
+    inputs are built whenever a part is run more than once.
+    """
+    day: int
+    parse: Callable[[TextIO], Any]
+    part_one: Callable[..., Any]
+    part_two: Optional[Callable[..., Any]] = None
+    fused: bool = False
+    unpack: bool = False
+    mutates: bool = False
+    input_file: str = ''
+
+    def __post_init__(self):
+        if not self.input_file:
+            self.input_file = f"{folder(self.day)}/{folder(self.day)}.in"
+        if self.fused != (self.part_two is None):
+            raise ValueError(f"Day {self.day} should have a part_two if and only if it isn't fused")
+
+    @property
+    def module(self):
+        """The module the solution is defined in"""
+        return inspect.getmodule(self.part_one)
+
+    def parts(self) -> Iterator[tuple[str, Callable[[Any], Any]]]:
+        """The phase name and function for each part, taking the parsed inputs"""
+        for phase, func in zip(PHASES[1:], (self.part_one, self.part_two)):
+            if func is None:
+                continue
+            if self.unpack:
+                yield phase, lambda inputs, func=func: func(*inputs)
+            else:
+                yield phase, func
+
+    def load(self, input_file: Optional[str] = None) -> Any:
+        """Parse the input file"""
+        with open(os.path.join(ROOT, input_file or self.input_file), encoding="utf8") as f:
+            return self.parse(f)
+
+    # run both solutions and print outputs + runtime
+    def main(self):
+        """The full days solution"""
+        print(f":: Advent of Code 2024 -- Day {self.day} ::")
+
+        # Parse inputs
+        print(":: Parsing Inputs ::")
+        t0 = -time.perf_counter()
+        inputs = self.load()
+        t0 += time.perf_counter()
+        print(f"runtime: {t0: .4f}s")
+
+        total = t0
+        for phase, func in self.parts():
+            if self.fused:
+                print(":: Part One + Two ::")
+            else:
+                print(f":: {phase.replace('_', ' ').title()} ::")
+            t = -time.perf_counter()
+            answer = func(inputs)
+            t += time.perf_counter()
+            if self.fused:
+                a1, a2 = answer
+                print(f"Part One Answer: {a1}")
+                print(f"Part Two Answer: {a2}")
+            else:
+                print(f"Answer: {answer}")
+            print(f"runtime: {t: .4f}s")
+            total += t
+
+        print(f":: total runtime: {total: .4f}s ::")
+
+
+REGISTRY: dict[int, Solution] = {}
+
+
+def register(solution: Solution) -> Solution:
+    """Add a day's solution to the registry"""
+    REGISTRY[solution.day] = solution
+    return solution
+
+
+def get(day: int) -> Solution:
+    """Get the registered solution for a day, importing it if needed"""
+    if day not in REGISTRY:
+        load_day(day)
+    return REGISTRY[day]